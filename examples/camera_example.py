@@ -13,7 +13,7 @@ from ..src.ecs.world import World
 from ..src.ecs.entity import Entity
 from ..src.events.event_manager import EventManager
 from ..src.events.event_types import EventType
-from ..src.components.transform import TransformComponent, Vector3
+from ..src.components.transform import TransformComponent
 from ..src.camera.system import CameraSystem
 from ..src.map.map import Map, TileType, CollisionType
 from ..src.map.system import MapSystem
@@ -22,7 +22,7 @@ from ..src.map.system import MapSystem
 def create_player(world, position=(5, 5, 0)):
     """Create a player entity at the specified position."""
     player = Entity()
-    transform = TransformComponent(Vector3(position[0], position[1], position[2]))
+    transform = TransformComponent(position[0], position[1], position[2])
     player.add_component(transform)
     entity_id = world.add_entity(player)
     
@@ -41,7 +41,7 @@ def create_enemies(world, count=5, bounds=(0, 0, 20, 20)):
         z = 0
         
         enemy = Entity()
-        transform = TransformComponent(Vector3(x, y, z))
+        transform = TransformComponent(x, y, z)
         enemy.add_component(transform)
         entity_id = world.add_entity(enemy)
         
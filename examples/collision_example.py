@@ -13,7 +13,7 @@ from ..src.ecs.world import World
 from ..src.ecs.entity import Entity
 from ..src.events.event_manager import EventManager
 from ..src.events.event_types import EventType
-from ..src.components.transform import TransformComponent, Vector3
+from ..src.components.transform import TransformComponent
 from ..src.collision.collision import (
     CollisionComponent,
     CircleShape,
@@ -32,7 +32,7 @@ def create_player(world, position=(5, 5, 0)):
     player = Entity()
     
     # Add transform component
-    transform = TransformComponent(Vector3(position[0], position[1], position[2]))
+    transform = TransformComponent(position[0], position[1], position[2])
     player.add_component(transform)
     
     # Add collision component with a circle shape
@@ -50,7 +50,7 @@ def create_wall(world, position, size=(1, 1)):
     wall = Entity()
     
     # Add transform component
-    transform = TransformComponent(Vector3(position[0], position[1], 0))
+    transform = TransformComponent(position[0], position[1], 0)
     wall.add_component(transform)
     
     # Add collision component with a rectangle shape
@@ -68,7 +68,7 @@ def create_trigger(world, position, radius=0.5):
     trigger = Entity()
     
     # Add transform component
-    transform = TransformComponent(Vector3(position[0], position[1], 0))
+    transform = TransformComponent(position[0], position[1], 0)
     trigger.add_component(transform)
     
     # Add collision component with a circle shape as a trigger
@@ -86,7 +86,7 @@ def create_enemy(world, position, radius=0.3):
     enemy = Entity()
     
     # Add transform component
-    transform = TransformComponent(Vector3(position[0], position[1], 0))
+    transform = TransformComponent(position[0], position[1], 0)
     enemy.add_component(transform)
     
     # Add collision component with a circle shape
@@ -14,6 +14,7 @@ from pathlib import Path
 # Add the src directory to the Python path
 sys.path.append(str(Path(__file__).parent.parent))
 
+from src.core import tick_clock
 from src.ecs.world import World
 from src.ecs.entity import Entity
 from src.events.event_manager import EventManager
@@ -21,6 +22,7 @@ from src.events.event_types import EventType
 from src.components import AIComponent, CharacterStatsComponent, TransformComponent, CombatComponent, CombatStance, AttackType
 from src.systems.ai_system import AISystem
 from src.systems.combat_system import CombatSystem
+from src.systems.lifecycle_system import LifecycleSystem
 
 def create_player(world, position):
     """Create a player entity."""
@@ -190,7 +192,7 @@ def handle_combat_event(event_type, event_data):
         entity_id = event_data.get("entity_id")
         print(f"Entity exited combat: {entity_id}")
 
-def simulate_combat(world, ai_system, combat_system, player_id, enemy_id, duration=10.0):
+def simulate_combat(world, ai_system, combat_system, lifecycle_system, player_id, enemy_id, duration=10.0):
     """Simulate combat between player and enemy for a duration."""
     start_time = time.time()
     elapsed = 0.0
@@ -217,6 +219,12 @@ def simulate_combat(world, ai_system, combat_system, player_id, enemy_id, durati
         dt = min(current_time - start_time - elapsed, 0.05)  # Cap at 50ms to prevent physics issues
         elapsed = current_time - start_time
         
+        # Capture the tick time (normally done by World.update)
+        tick_clock.advance()
+        
+        # Expire cooldowns, modifiers and status effects
+        lifecycle_system.update(dt)
+        
         # Update AI system
         ai_system.update(dt)
         
@@ -263,6 +271,9 @@ def main():
     # Create combat system
     combat_system = CombatSystem(world, event_manager)
     
+    # Create lifecycle system
+    lifecycle_system = LifecycleSystem(world)
+    
     # Create player
     player = create_player(world, (0, 0))
     
@@ -282,7 +293,7 @@ def main():
     print_entity_info(world, enemy, "Enemy")
     
     # Simulate combat
-    simulate_combat(world, ai_system, combat_system, player, enemy, duration=15.0)
+    simulate_combat(world, ai_system, combat_system, lifecycle_system, player, enemy, duration=15.0)
     
     # Print final state
     print("\n=== Final State ===\n")
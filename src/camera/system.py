@@ -231,11 +231,7 @@ class CameraSystem(System):
         # Get all entities with a TransformComponent
         entities = self.world.get_entities_with_component(TransformComponent)
         
-        for entity_id in entities:
-            entity = self.world.get_entity(entity_id)
-            if not entity:
-                continue
-                
+        for entity in entities:
             transform = entity.get_component(TransformComponent)
             if not transform:
                 continue
@@ -248,7 +244,7 @@ class CameraSystem(System):
                 transform.position.z,
                 1.0  # Default radius
             ):
-                visible_entities.append(entity_id)
+                visible_entities.append(entity.id)
         
         return visible_entities
     
@@ -8,17 +8,4 @@ from ..ecs.component import Component
 from .ai import AIComponent
 from .transform import TransformComponent
 from .character_stats import CharacterStatsComponent
-<<<<<<< HEAD
 from .combat import CombatComponent, CombatStance, AttackType
-from ..collision.collision import (
-    CollisionComponent, 
-    CollisionShape, 
-    CircleShape, 
-    RectangleShape, 
-    PointShape,
-    CollisionShapeType,
-    CollisionLayer
-)
-=======
-from .combat import CombatComponent, CombatStance, AttackType 
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
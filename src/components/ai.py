@@ -279,7 +279,9 @@ class AIComponent(Component):
         Returns:
             float: Distance between the positions
         """
-        return math.sqrt((pos1[0] - pos2[0])**2 + (pos1[1] - pos2[1])**2)
+        dx = pos1[0] - pos2[0]
+        dy = pos1[1] - pos2[1]
+        return math.sqrt(dx*dx + dy*dy)
     
     def find_nearest_enemy(self, own_position):
         """
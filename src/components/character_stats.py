@@ -2,8 +2,43 @@
 Character stats component for the Entity Component System.
 """
 
+import heapq
+from ..core import tick_clock
 from ..ecs.component import Component
 
+# Bound once so per-tick calls skip the module attribute lookup
+_now = tick_clock.now
+
+def _expiry_time(entry):
+    """Get the absolute expiry time of a modifier or effect, or None if permanent."""
+    if entry["duration"] is None:
+        return None
+    return entry["start_time"] + entry["duration"]
+
+def _build_expiry_heap(entries, current_time):
+    """Build a heap of (expiry time, ID) for timed modifiers or effects."""
+    heap = []
+    for entry_id, entry in entries.items():
+        if entry["start_time"] is None:
+            entry["start_time"] = current_time
+        expiry = _expiry_time(entry)
+        if expiry is not None:
+            heap.append((expiry, entry_id))
+    heapq.heapify(heap)
+    return heap
+
+def _pop_expired(heap, entries, current_time):
+    """Pop the heap entries that are due and return the IDs that expired."""
+    expired = []
+    while heap and heap[0][0] <= current_time:
+        expiry, entry_id = heapq.heappop(heap)
+        entry = entries.get(entry_id)
+        
+        # Skip entries left behind by removed or replaced IDs
+        if entry and _expiry_time(entry) == expiry:
+            expired.append(entry_id)
+    return expired
+
 class CharacterStatsComponent(Component):
     """
     Component that stores character statistics.
@@ -12,6 +47,22 @@ class CharacterStatsComponent(Component):
     capabilities, such as strength, dexterity, health, etc.
     """
     
+    # Base stats used when none are given
+    _DEFAULT_BASE_STATS = {
+        "strength": 10,
+        "dexterity": 10,
+        "constitution": 10,
+        "intelligence": 10,
+        "wisdom": 10,
+        "charisma": 10,
+        "max_health": 100,
+        "max_mana": 100,
+        "armor_class": 10,
+        "attack_power": 10,
+        "attack_speed": 1.0,
+        "movement_speed": 3.0
+    }
+    
     def __init__(self, base_stats=None):
         """
         Initialize the character stats component.
@@ -22,20 +73,7 @@ class CharacterStatsComponent(Component):
         super().__init__()
         
         # Base stats (permanent values)
-        self.base_stats = base_stats or {
-            "strength": 10,
-            "dexterity": 10,
-            "constitution": 10,
-            "intelligence": 10,
-            "wisdom": 10,
-            "charisma": 10,
-            "max_health": 100,
-            "max_mana": 100,
-            "armor_class": 10,
-            "attack_power": 10,
-            "attack_speed": 1.0,
-            "movement_speed": 3.0
-        }
+        self.base_stats = base_stats or self._DEFAULT_BASE_STATS.copy()
         
         # Current stats (base + modifiers)
         self.current_stats = self.base_stats.copy()
@@ -49,22 +87,36 @@ class CharacterStatsComponent(Component):
         
         # Status effects
         self.status_effects = {}  # Effect ID -> {type, duration, strength}
+        self._effects_by_type = {}  # Effect type -> Set of effect IDs
+        self._max_strength_by_type = {}  # Effect type -> strongest effect strength
+        
+        # Expiry heaps of (expiry time, ID) for timed modifiers and effects
+        self._modifier_expiry = []
+        self._effect_expiry = []
     
     def serialize(self):
         """
         Convert component data to a serializable format.
         
+        Fields that deserialize would rebuild to the same value are left out.
+        
         Returns:
             dict: Serialized component data
         """
-        return {
-            "base_stats": self.base_stats,
-            "current_stats": self.current_stats,
-            "modifiers": self.modifiers,
-            "health": self.health,
-            "mana": self.mana,
-            "status_effects": self.status_effects
-        }
+        data = {}
+        if self.base_stats != self._DEFAULT_BASE_STATS:
+            data["base_stats"] = self.base_stats
+        if self.modifiers:
+            data["modifiers"] = self.modifiers
+        if self.current_stats != self._compute_current_stats():
+            data["current_stats"] = self.current_stats
+        if self.health != self.current_stats.get("max_health", 100):
+            data["health"] = self.health
+        if self.mana != self.current_stats.get("max_mana", 100):
+            data["mana"] = self.mana
+        if self.status_effects:
+            data["status_effects"] = self.status_effects
+        return data
     
     @classmethod
     def deserialize(cls, data):
@@ -78,13 +130,25 @@ class CharacterStatsComponent(Component):
             CharacterStatsComponent: New component instance
         """
         component = cls(data.get("base_stats", {}))
-        component.current_stats = data.get("current_stats", component.base_stats.copy())
         component.modifiers = data.get("modifiers", {})
+        if "current_stats" in data:
+            component.current_stats = data["current_stats"]
+        else:
+            component._apply_modifiers()
         component.health = data.get("health", component.current_stats.get("max_health", 100))
         component.mana = data.get("mana", component.current_stats.get("max_mana", 100))
         component.status_effects = data.get("status_effects", {})
+        for effect_id, effect in component.status_effects.items():
+            component._index_status_effect(effect_id, effect)
+        component._rebuild_expiry_heaps()
         return component
     
+    def _rebuild_expiry_heaps(self):
+        """Rebuild the expiry heaps from the stored modifiers and effects."""
+        current_time = _now()
+        self._modifier_expiry = _build_expiry_heap(self.modifiers, current_time)
+        self._effect_expiry = _build_expiry_heap(self.status_effects, current_time)
+    
     def add_modifier(self, modifier_id, stat, value, duration=None):
         """
         Add a stat modifier.
@@ -98,15 +162,25 @@ class CharacterStatsComponent(Component):
         Returns:
             CharacterStatsComponent: Self for method chaining
         """
-        self.modifiers[modifier_id] = {
+        # Take back the old modifier if this ID is being replaced
+        self._unapply_modifier(self.modifiers.get(modifier_id))
+        
+        start_time = _now()
+        modifier = {
             "stat": stat,
             "value": value,
             "duration": duration,
-            "start_time": None  # Will be set when applied
+            "start_time": start_time
         }
+        self.modifiers[modifier_id] = modifier
+        
+        # Schedule expiry for timed modifiers
+        if duration is not None:
+            heapq.heappush(self._modifier_expiry, (start_time + duration, modifier_id))
         
         # Apply the modifier
-        self._apply_modifiers()
+        if stat in self.current_stats:
+            self.current_stats[stat] += value
         
         return self
     
@@ -124,25 +198,46 @@ class CharacterStatsComponent(Component):
             modifier = self.modifiers[modifier_id]
             del self.modifiers[modifier_id]
             
-            # Reapply all modifiers
-            self._apply_modifiers()
+            # Take back only this modifier's contribution
+            self._unapply_modifier(modifier)
             
             return modifier
         
         return None
     
+    def _unapply_modifier(self, modifier):
+        """Subtract a single modifier's value from the current stats."""
+        if modifier and modifier["stat"] in self.current_stats:
+            self.current_stats[modifier["stat"]] -= modifier["value"]
+    
     def _apply_modifiers(self):
-        """Apply all stat modifiers to calculate current stats."""
-        # Reset current stats to base stats
-        self.current_stats = self.base_stats.copy()
+        """
+        Recalculate current stats from base stats and all modifiers.
+        
+        Adding and removing modifiers updates current stats incrementally;
+        call this after changing base stats directly.
+        """
+        self.current_stats = self._compute_current_stats()
+    
+    def _compute_current_stats(self):
+        """
+        Calculate current stats from base stats and all modifiers.
+        
+        Returns:
+            dict: Stat name -> current value
+        """
+        # Start from base stats
+        current_stats = self.base_stats.copy()
         
         # Apply each modifier
         for modifier_id, modifier in self.modifiers.items():
             stat = modifier["stat"]
             value = modifier["value"]
             
-            if stat in self.current_stats:
-                self.current_stats[stat] += value
+            if stat in current_stats:
+                current_stats[stat] += value
+        
+        return current_stats
     
     def update_modifiers(self, dt):
         """
@@ -151,25 +246,7 @@ class CharacterStatsComponent(Component):
         Args:
             dt: Delta time in seconds
         """
-        # Set start time for new modifiers
-        import time
-        current_time = time.time()
-        
-        for modifier_id, modifier in self.modifiers.items():
-            if modifier["start_time"] is None:
-                modifier["start_time"] = current_time
-        
-        # Check for expired modifiers
-        expired = []
-        
-        for modifier_id, modifier in self.modifiers.items():
-            if modifier["duration"] is not None:
-                elapsed = current_time - modifier["start_time"]
-                if elapsed >= modifier["duration"]:
-                    expired.append(modifier_id)
-        
-        # Remove expired modifiers
-        for modifier_id in expired:
+        for modifier_id in _pop_expired(self._modifier_expiry, self.modifiers, _now()):
             self.remove_modifier(modifier_id)
     
     def add_status_effect(self, effect_id, effect_type, strength=1.0, duration=None):
@@ -185,12 +262,23 @@ class CharacterStatsComponent(Component):
         Returns:
             CharacterStatsComponent: Self for method chaining
         """
-        self.status_effects[effect_id] = {
+        # Drop the old effect from the type index if this ID is being replaced
+        if effect_id in self.status_effects:
+            self._unindex_status_effect(effect_id, self.status_effects[effect_id])
+        
+        start_time = _now()
+        effect = {
             "type": effect_type,
             "strength": strength,
             "duration": duration,
-            "start_time": None  # Will be set when applied
+            "start_time": start_time
         }
+        self.status_effects[effect_id] = effect
+        self._index_status_effect(effect_id, effect)
+        
+        # Schedule expiry for timed effects
+        if duration is not None:
+            heapq.heappush(self._effect_expiry, (start_time + duration, effect_id))
         
         return self
     
@@ -207,10 +295,39 @@ class CharacterStatsComponent(Component):
         if effect_id in self.status_effects:
             effect = self.status_effects[effect_id]
             del self.status_effects[effect_id]
+            self._unindex_status_effect(effect_id, effect)
             return effect
         
         return None
     
+    def _index_status_effect(self, effect_id, effect):
+        """Add a status effect to the per-type index."""
+        effect_type = effect["type"]
+        self._effects_by_type.setdefault(effect_type, set()).add(effect_id)
+        
+        if effect["strength"] > self._max_strength_by_type.get(effect_type, 0.0):
+            self._max_strength_by_type[effect_type] = effect["strength"]
+    
+    def _unindex_status_effect(self, effect_id, effect):
+        """Remove a status effect from the per-type index."""
+        effect_type = effect["type"]
+        effect_ids = self._effects_by_type.get(effect_type)
+        if effect_ids is None:
+            return
+        
+        effect_ids.discard(effect_id)
+        if not effect_ids:
+            del self._effects_by_type[effect_type]
+            self._max_strength_by_type.pop(effect_type, None)
+            return
+        
+        # Recompute the strongest effect only if it was the one removed
+        if effect["strength"] >= self._max_strength_by_type.get(effect_type, 0.0):
+            max_strength = 0.0
+            for other_id in effect_ids:
+                max_strength = max(max_strength, self.status_effects[other_id]["strength"])
+            self._max_strength_by_type[effect_type] = max_strength
+    
     def update_status_effects(self, dt):
         """
         Update status effects, removing expired ones.
@@ -218,26 +335,24 @@ class CharacterStatsComponent(Component):
         Args:
             dt: Delta time in seconds
         """
-        # Set start time for new effects
-        import time
-        current_time = time.time()
-        
-        for effect_id, effect in self.status_effects.items():
-            if effect["start_time"] is None:
-                effect["start_time"] = current_time
-        
-        # Check for expired effects
-        expired = []
+        for effect_id in _pop_expired(self._effect_expiry, self.status_effects, _now()):
+            self.remove_status_effect(effect_id)
+    
+    def tick(self, dt, now):
+        """
+        Expire modifiers and status effects in a single pass.
         
-        for effect_id, effect in self.status_effects.items():
-            if effect["duration"] is not None:
-                elapsed = current_time - effect["start_time"]
-                if elapsed >= effect["duration"]:
-                    expired.append(effect_id)
+        Args:
+            dt: Delta time in seconds
+            now: Current tick time
+        """
+        if self._modifier_expiry and self._modifier_expiry[0][0] <= now:
+            for modifier_id in _pop_expired(self._modifier_expiry, self.modifiers, now):
+                self.remove_modifier(modifier_id)
         
-        # Remove expired effects
-        for effect_id in expired:
-            self.remove_status_effect(effect_id)
+        if self._effect_expiry and self._effect_expiry[0][0] <= now:
+            for effect_id in _pop_expired(self._effect_expiry, self.status_effects, now):
+                self.remove_status_effect(effect_id)
     
     def has_status_effect(self, effect_type):
         """
@@ -249,11 +364,7 @@ class CharacterStatsComponent(Component):
         Returns:
             bool: True if the character has the effect, False otherwise
         """
-        for effect in self.status_effects.values():
-            if effect["type"] == effect_type:
-                return True
-        
-        return False
+        return effect_type in self._effects_by_type
     
     def get_status_effect_strength(self, effect_type):
         """
@@ -265,13 +376,7 @@ class CharacterStatsComponent(Component):
         Returns:
             float: The strength of the effect, or 0.0 if not found
         """
-        max_strength = 0.0
-        
-        for effect in self.status_effects.values():
-            if effect["type"] == effect_type and effect["strength"] > max_strength:
-                max_strength = effect["strength"]
-        
-        return max_strength
+        return self._max_strength_by_type.get(effect_type, 0.0)
     
     def take_damage(self, amount):
         """
@@ -4,11 +4,36 @@ Combat component for the Entity Component System.
 This component stores combat-related data and state for entities.
 """
 
+import copy
+import heapq
+import math
 import random
-import time
+from collections import OrderedDict, defaultdict
 from enum import Enum
+from ..core import tick_clock
 from ..ecs.component import Component
 
+# Bound once so per-tick calls skip the module attribute lookup
+_now = tick_clock.now
+
+# Kinds of buffered combat statistic events
+_DAMAGE_DEALT = 0
+_DAMAGE_TAKEN = 1
+_HEALING_DONE = 2
+_ATTACK_MISSED = 3
+_KILL = 4
+
+def _load_id(entity_id):
+    """
+    Restore an entity ID read from save data.
+    
+    JSON turns integer dict keys into strings, so those are turned back
+    into ints; other strings are UUIDs from older saves and are kept.
+    """
+    if type(entity_id) is str and entity_id.isdigit():
+        return int(entity_id)
+    return entity_id
+
 class CombatStance(Enum):
     """Combat stance enumeration."""
     NEUTRAL = 0
@@ -21,6 +46,64 @@ class AttackType(Enum):
     RANGED = 1
     SPELL = 2
 
+class _AttackRangeField:
+    """Attribute view of one attack type's slot in the attack range table."""
+    
+    def __init__(self, attack_type):
+        self.index = attack_type.value
+    
+    def __get__(self, component, owner=None):
+        if component is None:
+            return self
+        return component._attack_ranges[self.index]
+    
+    def __set__(self, component, value):
+        component._attack_ranges[self.index] = value
+
+def _compile_field_methods(cls):
+    """
+    Class decorator that generates __init__ and serialize from field tables.
+    
+    The generated methods are straight-line attribute stores and default
+    checks built from _INIT_FIELDS, _DEFAULTS and _SERIALIZED_FORMS, so
+    neither loops over fields or looks up conversions at runtime.
+    """
+    namespace = {
+        "Component": Component,
+        "CombatStance": CombatStance,
+        "AttackType": AttackType,
+        "defaultdict": defaultdict,
+        "math": math
+    }
+    
+    init_source = ["def __init__(self):", "    Component.__init__(self)"]
+    for name, value_source in cls._INIT_FIELDS:
+        init_source.append(f"    self.{name} = {value_source}")
+    
+    serialize_source = [
+        "def serialize(self):",
+        "    if self._pending_events:",
+        "        self.flush()",
+        "    data = {}"
+    ]
+    for key, default in cls._DEFAULTS.items():
+        value_source = cls._SERIALIZED_FORMS.get(key, "{}").format(f"self.{key}")
+        serialize_source.append(f"    value = {value_source}")
+        serialize_source.append(f"    if value != {default!r}:")
+        serialize_source.append(f"        data[{key!r}] = value")
+    serialize_source.append("    return data")
+    
+    exec("\n".join(init_source + serialize_source), namespace)
+    
+    for name, doc in (("__init__", cls._INIT_DOC), ("serialize", cls._SERIALIZE_DOC)):
+        method = namespace[name]
+        method.__doc__ = doc
+        method.__qualname__ = f"{cls.__name__}.{name}"
+        setattr(cls, name, method)
+    
+    return cls
+
+@_compile_field_methods
 class CombatComponent(Component):
     """
     Component that manages combat state and actions.
@@ -29,131 +112,185 @@ class CombatComponent(Component):
     combat stance, target information, and combat state.
     """
     
-    def __init__(self):
-        """Initialize the combat component."""
-        super().__init__()
-        
+    # Serialized fields and their default values
+    _DEFAULTS = {
+        "in_combat": False,
+        "combat_start_time": 0,
+        "last_combat_action_time": 0,
+        "stance": CombatStance.NEUTRAL.value,
+        "preferred_attack_type": AttackType.MELEE.value,
+        "global_cooldown": 0.0,
+        "opportunity_attacks": 3,
+        "opportunity_attacks_used": 0,
+        "current_target_id": None,
+        "targeted_by": [],
+        "threat_table": {},
+        "damage_dealt": 0,
+        "damage_taken": 0,
+        "healing_done": 0,
+        "critical_hits": 0,
+        "attacks_landed": 0,
+        "attacks_missed": 0,
+        "kills": 0,
+        "damage_multiplier": 1.0,
+        "defense_multiplier": 1.0,
+        "critical_chance_bonus": 0.0,
+        "dodge_chance_bonus": 0.0,
+        "melee_range": 1.5,
+        "ranged_range": 10.0,
+        "spell_range": 8.0,
+        "auto_attack_enabled": False,
+        "auto_attack_interval": 2.0
+    }
+    
+    # Source templates for fields whose serialized form differs from the attribute
+    _SERIALIZED_FORMS = {
+        "stance": "{}.value",
+        "preferred_attack_type": "{}.value",
+        "targeted_by": "list({})",
+        "threat_table": "dict({})"
+    }
+    
+    # Conversions back from the serialized form
+    _DESERIALIZERS = {
+        "stance": CombatStance,
+        "preferred_attack_type": AttackType,
+        "current_target_id": _load_id,
+        "targeted_by": lambda entity_ids: {_load_id(entity_id) for entity_id in entity_ids},
+        "threat_table": lambda table: defaultdict(float, ((_load_id(entity_id), threat) for entity_id, threat in table.items()))
+    }
+    
+    # Deserialized templates keyed by their data, least recently used first
+    _deserialize_cache = OrderedDict()
+    
+    # Templates kept before the least recently used one is dropped
+    _MAX_CACHED_TEMPLATES = 256
+    
+    # Named access to the attack range table
+    melee_range = _AttackRangeField(AttackType.MELEE)
+    ranged_range = _AttackRangeField(AttackType.RANGED)
+    spell_range = _AttackRangeField(AttackType.SPELL)
+    
+    # Attributes set by the generated __init__ and the source of their values
+    _INIT_FIELDS = (
         # Combat state
-        self.in_combat = False
-        self.combat_start_time = 0
-        self.last_combat_action_time = 0
-        self.last_damage_taken_time = 0
-        self.last_damage_dealt_time = 0
+        ("in_combat", "False"),
+        ("combat_start_time", "0"),
+        ("last_combat_action_time", "0"),
+        ("last_damage_taken_time", "0"),
+        ("last_damage_dealt_time", "0"),
         
         # Combat properties
-        self.stance = CombatStance.NEUTRAL
-        self.preferred_attack_type = AttackType.MELEE
-        self.attack_cooldowns = {}  # Attack ID -> cooldown remaining
-        self.global_cooldown = 0.0
-        self.opportunity_attacks = 3  # Opportunity attacks per round
-        self.opportunity_attacks_used = 0
+        ("stance", "CombatStance.NEUTRAL"),
+        ("preferred_attack_type", "AttackType.MELEE"),
+        ("attack_cooldowns", "{}"),  # Attack ID -> cooldown expiry time
+        ("_cooldown_expiry", "[]"),  # Heap of (expiry time, attack ID)
+        ("global_cooldown", "0.0"),
+        ("opportunity_attacks", "3"),  # Opportunity attacks per round
+        ("opportunity_attacks_used", "0"),
         
         # Targeting
-        self.current_target_id = None
-        self.targeted_by = set()  # Set of entity IDs targeting this entity
-        self.threat_table = {}  # Entity ID -> threat value
+        ("current_target_id", "None"),
+        ("targeted_by", "set()"),  # Set of entity IDs targeting this entity
+        ("threat_table", "defaultdict(float)"),  # Entity ID -> threat value
+        ("_top_threat_id", "None"),  # Entity ID with the highest threat
+        ("_top_threat", "0"),
         
         # Combat statistics (for this session)
-        self.damage_dealt = 0
-        self.damage_taken = 0
-        self.healing_done = 0
-        self.critical_hits = 0
-        self.attacks_landed = 0
-        self.attacks_missed = 0
-        self.kills = 0
+        ("damage_dealt", "0"),
+        ("damage_taken", "0"),
+        ("healing_done", "0"),
+        ("critical_hits", "0"),
+        ("attacks_landed", "0"),
+        ("attacks_missed", "0"),
+        ("kills", "0"),
+        ("_pending_events", "[]"),  # Buffered (kind, amount, critical) until flush
         
         # Temporary combat modifiers
-        self.damage_multiplier = 1.0
-        self.defense_multiplier = 1.0
-        self.critical_chance_bonus = 0.0
-        self.dodge_chance_bonus = 0.0
+        ("damage_multiplier", "1.0"),
+        ("defense_multiplier", "1.0"),
+        ("critical_chance_bonus", "0.0"),
+        ("dodge_chance_bonus", "0.0"),
         
-        # Combat range
-        self.melee_range = 1.5  # Default melee range in tiles
-        self.ranged_range = 10.0  # Default ranged attack range in tiles
-        self.spell_range = 8.0  # Default spell range in tiles
+        # Combat range in tiles, indexed by AttackType value (melee, ranged, spell)
+        ("_attack_ranges", "[1.5, 10.0, 8.0]"),
         
         # Auto-attack settings
-        self.auto_attack_enabled = False
-        self.auto_attack_interval = 2.0  # Seconds between auto-attacks
-        self.last_auto_attack_time = 0
+        ("_auto_attack_enabled", "False"),
+        ("_auto_attack_interval", "2.0"),  # Seconds between auto-attacks
+        ("last_auto_attack_time", "0"),
+        ("_next_auto_attack_time", "math.inf")  # When the next auto-attack is due
+    )
     
-    def serialize(self):
-        """
+    _INIT_DOC = """Initialize the combat component."""
+    
+    _SERIALIZE_DOC = """
         Convert component data to a serializable format.
         
+        Fields still at their default value are left out.
+        
         Returns:
             dict: Serialized component data
         """
-        return {
-            "in_combat": self.in_combat,
-            "combat_start_time": self.combat_start_time,
-            "last_combat_action_time": self.last_combat_action_time,
-            "stance": self.stance.value,
-            "preferred_attack_type": self.preferred_attack_type.value,
-            "global_cooldown": self.global_cooldown,
-            "opportunity_attacks": self.opportunity_attacks,
-            "opportunity_attacks_used": self.opportunity_attacks_used,
-            "current_target_id": self.current_target_id,
-            "targeted_by": list(self.targeted_by),
-            "threat_table": self.threat_table,
-            "damage_dealt": self.damage_dealt,
-            "damage_taken": self.damage_taken,
-            "healing_done": self.healing_done,
-            "critical_hits": self.critical_hits,
-            "attacks_landed": self.attacks_landed,
-            "attacks_missed": self.attacks_missed,
-            "kills": self.kills,
-            "damage_multiplier": self.damage_multiplier,
-            "defense_multiplier": self.defense_multiplier,
-            "critical_chance_bonus": self.critical_chance_bonus,
-            "dodge_chance_bonus": self.dodge_chance_bonus,
-            "melee_range": self.melee_range,
-            "ranged_range": self.ranged_range,
-            "spell_range": self.spell_range,
-            "auto_attack_enabled": self.auto_attack_enabled,
-            "auto_attack_interval": self.auto_attack_interval
-        }
     
     @classmethod
     def deserialize(cls, data):
         """
         Create a component from serialized data.
         
+        Identical save data (e.g. many copies of the same enemy) is only
+        parsed once; later calls return a copy of the cached result.
+        
         Args:
             data: Serialized component data
             
         Returns:
             CombatComponent: New component instance
         """
+        # Value types are part of the key, since 1, 1.0 and True hash and
+        # compare equal but deserialize differently
+        try:
+            key = frozenset((name, type(value), value) for name, value in data.items())
+        except TypeError:
+            # Unhashable values such as a threat table, skip the cache
+            return cls._from_data(data)
+        
+        cache = cls._deserialize_cache
+        template = cache.get(key)
+        if template is None:
+            template = cls._from_data(data)
+            cache[key] = template
+            if len(cache) > cls._MAX_CACHED_TEMPLATES:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        
+        return copy.copy(template)
+    
+    @classmethod
+    def _from_data(cls, data):
+        """Build a component from serialized data without the cache."""
         component = cls()
-        component.in_combat = data.get("in_combat", False)
-        component.combat_start_time = data.get("combat_start_time", 0)
-        component.last_combat_action_time = data.get("last_combat_action_time", 0)
-        component.stance = CombatStance(data.get("stance", CombatStance.NEUTRAL.value))
-        component.preferred_attack_type = AttackType(data.get("preferred_attack_type", AttackType.MELEE.value))
-        component.global_cooldown = data.get("global_cooldown", 0.0)
-        component.opportunity_attacks = data.get("opportunity_attacks", 3)
-        component.opportunity_attacks_used = data.get("opportunity_attacks_used", 0)
-        component.current_target_id = data.get("current_target_id")
-        component.targeted_by = set(data.get("targeted_by", []))
-        component.threat_table = data.get("threat_table", {})
-        component.damage_dealt = data.get("damage_dealt", 0)
-        component.damage_taken = data.get("damage_taken", 0)
-        component.healing_done = data.get("healing_done", 0)
-        component.critical_hits = data.get("critical_hits", 0)
-        component.attacks_landed = data.get("attacks_landed", 0)
-        component.attacks_missed = data.get("attacks_missed", 0)
-        component.kills = data.get("kills", 0)
-        component.damage_multiplier = data.get("damage_multiplier", 1.0)
-        component.defense_multiplier = data.get("defense_multiplier", 1.0)
-        component.critical_chance_bonus = data.get("critical_chance_bonus", 0.0)
-        component.dodge_chance_bonus = data.get("dodge_chance_bonus", 0.0)
-        component.melee_range = data.get("melee_range", 1.5)
-        component.ranged_range = data.get("ranged_range", 10.0)
-        component.spell_range = data.get("spell_range", 8.0)
-        component.auto_attack_enabled = data.get("auto_attack_enabled", False)
-        component.auto_attack_interval = data.get("auto_attack_interval", 2.0)
+        for key, value in data.items():
+            if key in cls._DEFAULTS:
+                if key in cls._DESERIALIZERS:
+                    value = cls._DESERIALIZERS[key](value)
+                setattr(component, key, value)
+        component._recompute_top_threat()
+        component._schedule_auto_attack()
+        return component
+    
+    def __copy__(self):
+        """Copy the component, giving the copy its own mutable containers."""
+        component = self.__class__.__new__(self.__class__)
+        component.__dict__.update(self.__dict__)
+        component.entity = self.entity  # Slot on Component, not in __dict__
+        component.attack_cooldowns = dict(self.attack_cooldowns)
+        component._cooldown_expiry = list(self._cooldown_expiry)
+        component.targeted_by = set(self.targeted_by)
+        component.threat_table = defaultdict(float, self.threat_table)
+        component._attack_ranges = list(self._attack_ranges)
+        component._pending_events = list(self._pending_events)
         return component
     
     def enter_combat(self):
@@ -165,8 +302,9 @@ class CombatComponent(Component):
         """
         if not self.in_combat:
             self.in_combat = True
-            self.combat_start_time = time.time()
+            self.combat_start_time = _now()
             self.opportunity_attacks_used = 0
+            self._schedule_auto_attack()
             return True
         return False
     
@@ -181,6 +319,7 @@ class CombatComponent(Component):
             self.in_combat = False
             self.current_target_id = None
             self.reset_threat_table()
+            self._schedule_auto_attack()
             return True
         return False
     
@@ -195,6 +334,7 @@ class CombatComponent(Component):
             CombatComponent: Self for method chaining
         """
         self.current_target_id = target_id
+        self._schedule_auto_attack()
         return self
     
     def clear_target(self):
@@ -205,6 +345,7 @@ class CombatComponent(Component):
             CombatComponent: Self for method chaining
         """
         self.current_target_id = None
+        self._schedule_auto_attack()
         return self
     
     def add_targeted_by(self, entity_id):
@@ -257,10 +398,53 @@ class CombatComponent(Component):
         Returns:
             CombatComponent: Self for method chaining
         """
-        current = self.threat_table.get(entity_id, 0)
-        self.threat_table[entity_id] = current + amount
+        threat = self.threat_table[entity_id] + amount
+        self.threat_table[entity_id] = threat
+        
+        # Keep the highest-threat entity up to date
+        if self._top_threat_id is None or threat > self._top_threat:
+            self._top_threat_id = entity_id
+            self._top_threat = threat
+        elif entity_id == self._top_threat_id:
+            if amount < 0:
+                self._recompute_top_threat()
+            else:
+                self._top_threat = threat
+        
         return self
     
+    def add_threat_batch(self, threats):
+        """
+        Add threat for several entities at once, e.g. from an area attack.
+        
+        Args:
+            threats: Dictionary of entity ID -> amount of threat to add
+            
+        Returns:
+            CombatComponent: Self for method chaining
+        """
+        threat_table = self.threat_table
+        for entity_id, amount in threats.items():
+            threat_table[entity_id] += amount
+        
+        self._recompute_top_threat()
+        return self
+    
+    def remove_threat(self, entity_id):
+        """
+        Remove an entity from the threat table.
+        
+        Args:
+            entity_id: ID of the entity to remove
+            
+        Returns:
+            float: The removed threat value, or 0 if not found
+        """
+        threat = self.threat_table.pop(entity_id, 0)
+        if entity_id == self._top_threat_id:
+            self._recompute_top_threat()
+        return threat
+    
     def get_threat(self, entity_id):
         """
         Get the threat value for an entity.
@@ -280,11 +464,20 @@ class CombatComponent(Component):
         Returns:
             tuple: (entity_id, threat_value) or (None, 0) if no threats
         """
-        if not self.threat_table:
+        if self._top_threat_id is None:
             return None, 0
         
-        highest_entity = max(self.threat_table.items(), key=lambda x: x[1])
-        return highest_entity
+        return self._top_threat_id, self._top_threat
+    
+    def _recompute_top_threat(self):
+        """Find the highest-threat entity by scanning the threat table."""
+        self._top_threat_id = None
+        self._top_threat = 0
+        
+        for entity_id, threat in self.threat_table.items():
+            if self._top_threat_id is None or threat > self._top_threat:
+                self._top_threat_id = entity_id
+                self._top_threat = threat
     
     def reset_threat_table(self):
         """
@@ -294,6 +487,8 @@ class CombatComponent(Component):
             CombatComponent: Self for method chaining
         """
         self.threat_table.clear()
+        self._top_threat_id = None
+        self._top_threat = 0
         return self
     
     def set_stance(self, stance):
@@ -329,16 +524,33 @@ class CombatComponent(Component):
         Args:
             dt: Delta time in seconds
             
+        Returns:
+            CombatComponent: Self for method chaining
+        """
+        return self.tick(dt, _now())
+    
+    def tick(self, dt, now):
+        """
+        Advance all timed combat state by one frame.
+        
+        Args:
+            dt: Delta time in seconds
+            now: Current tick time
+            
         Returns:
             CombatComponent: Self for method chaining
         """
         # Update global cooldown
-        self.global_cooldown = max(0.0, self.global_cooldown - dt)
+        if self.global_cooldown > 0:
+            self.global_cooldown = max(0.0, self.global_cooldown - dt)
         
-        # Update attack cooldowns
-        for attack_id in list(self.attack_cooldowns.keys()):
-            self.attack_cooldowns[attack_id] -= dt
-            if self.attack_cooldowns[attack_id] <= 0:
+        # Drop attack cooldowns that have expired
+        heap = self._cooldown_expiry
+        while heap and heap[0][0] <= now:
+            expiry, attack_id = heapq.heappop(heap)
+            
+            # Skip entries left behind by restarted cooldowns
+            if self.attack_cooldowns.get(attack_id) == expiry:
                 del self.attack_cooldowns[attack_id]
         
         return self
@@ -353,7 +565,7 @@ class CombatComponent(Component):
         Returns:
             bool: True if the attack is on cooldown
         """
-        return attack_id in self.attack_cooldowns or self.global_cooldown > 0
+        return self.attack_cooldowns.get(attack_id, 0) > _now() or self.global_cooldown > 0
     
     def start_cooldown(self, attack_id, duration):
         """
@@ -366,7 +578,9 @@ class CombatComponent(Component):
         Returns:
             CombatComponent: Self for method chaining
         """
-        self.attack_cooldowns[attack_id] = duration
+        expiry = _now() + duration
+        self.attack_cooldowns[attack_id] = expiry
+        heapq.heappush(self._cooldown_expiry, (expiry, attack_id))
         return self
     
     def start_global_cooldown(self, duration=1.0):
@@ -417,6 +631,8 @@ class CombatComponent(Component):
         """
         Record damage dealt in combat statistics.
         
+        Statistics are buffered and applied on the next flush().
+        
         Args:
             amount: Amount of damage dealt
             critical: Whether it was a critical hit
@@ -424,60 +640,113 @@ class CombatComponent(Component):
         Returns:
             CombatComponent: Self for method chaining
         """
-        self.damage_dealt += amount
-        self.attacks_landed += 1
-        self.last_damage_dealt_time = time.time()
-        
-        if critical:
-            self.critical_hits += 1
-        
+        self._pending_events.append((_DAMAGE_DEALT, amount, critical))
         return self
     
     def record_damage_taken(self, amount):
         """
         Record damage taken in combat statistics.
         
+        Statistics are buffered and applied on the next flush().
+        
         Args:
             amount: Amount of damage taken
             
         Returns:
             CombatComponent: Self for method chaining
         """
-        self.damage_taken += amount
-        self.last_damage_taken_time = time.time()
+        self._pending_events.append((_DAMAGE_TAKEN, amount, False))
         return self
     
     def record_healing_done(self, amount):
         """
         Record healing done in combat statistics.
         
+        Statistics are buffered and applied on the next flush().
+        
         Args:
             amount: Amount of healing done
             
         Returns:
             CombatComponent: Self for method chaining
         """
-        self.healing_done += amount
+        self._pending_events.append((_HEALING_DONE, amount, False))
         return self
     
     def record_attack_missed(self):
         """
         Record a missed attack in combat statistics.
         
+        Statistics are buffered and applied on the next flush().
+        
         Returns:
             CombatComponent: Self for method chaining
         """
-        self.attacks_missed += 1
+        self._pending_events.append((_ATTACK_MISSED, 0, False))
         return self
     
     def record_kill(self):
         """
         Record a kill in combat statistics.
         
+        Statistics are buffered and applied on the next flush().
+        
         Returns:
             CombatComponent: Self for method chaining
         """
-        self.kills += 1
+        self._pending_events.append((_KILL, 0, False))
+        return self
+    
+    def flush(self, now=None):
+        """
+        Apply buffered combat statistic events.
+        
+        Args:
+            now: Time to record for damage events, or None for the current tick time
+            
+        Returns:
+            CombatComponent: Self for method chaining
+        """
+        events = self._pending_events
+        if not events:
+            return self
+        
+        damage_dealt = damage_taken = healing_done = 0
+        attacks_landed = critical_hits = attacks_missed = kills = 0
+        hits_taken = 0
+        
+        for kind, amount, critical in events:
+            if kind == _DAMAGE_DEALT:
+                damage_dealt += amount
+                attacks_landed += 1
+                if critical:
+                    critical_hits += 1
+            elif kind == _DAMAGE_TAKEN:
+                damage_taken += amount
+                hits_taken += 1
+            elif kind == _HEALING_DONE:
+                healing_done += amount
+            elif kind == _ATTACK_MISSED:
+                attacks_missed += 1
+            else:
+                kills += 1
+        events.clear()
+        
+        if now is None:
+            now = _now()
+        
+        if attacks_landed:
+            self.damage_dealt += damage_dealt
+            self.attacks_landed += attacks_landed
+            self.critical_hits += critical_hits
+            self.last_damage_dealt_time = now
+        if hits_taken:
+            self.damage_taken += damage_taken
+            self.last_damage_taken_time = now
+        self.healing_done += healing_done
+        self.attacks_missed += attacks_missed
+        self.kills += kills
+        
         return self
     
     def toggle_auto_attack(self):
@@ -490,20 +759,41 @@ class CombatComponent(Component):
         self.auto_attack_enabled = not self.auto_attack_enabled
         return self.auto_attack_enabled
     
-    def should_auto_attack(self, current_time):
+    @property
+    def auto_attack_enabled(self):
+        """bool: Whether auto-attacks are enabled."""
+        return self._auto_attack_enabled
+    
+    @auto_attack_enabled.setter
+    def auto_attack_enabled(self, enabled):
+        self._auto_attack_enabled = enabled
+        self._schedule_auto_attack()
+    
+    @property
+    def auto_attack_interval(self):
+        """float: Seconds between auto-attacks."""
+        return self._auto_attack_interval
+    
+    @auto_attack_interval.setter
+    def auto_attack_interval(self, interval):
+        self._auto_attack_interval = interval
+        self._schedule_auto_attack()
+    
+    def _schedule_auto_attack(self):
+        """Recalculate when the next auto-attack is due."""
+        if self._auto_attack_enabled and self.in_combat and self.current_target_id:
+            self._next_auto_attack_time = self.last_auto_attack_time + self._auto_attack_interval
+        else:
+            self._next_auto_attack_time = math.inf
+    
+    def should_auto_attack(self):
         """
-        Check if an auto-attack should occur.
+        Check if an auto-attack should occur this tick.
         
-        Args:
-            current_time: Current time
-            
         Returns:
             bool: True if an auto-attack should occur
         """
-        if not self.auto_attack_enabled or not self.in_combat or not self.current_target_id:
-            return False
-        
-        return current_time - self.last_auto_attack_time >= self.auto_attack_interval
+        return _now() >= self._next_auto_attack_time
     
     def update_last_auto_attack_time(self):
         """
@@ -512,7 +802,8 @@ class CombatComponent(Component):
         Returns:
             CombatComponent: Self for method chaining
         """
-        self.last_auto_attack_time = time.time()
+        self.last_auto_attack_time = _now()
+        self._schedule_auto_attack()
         return self
     
     def update_last_combat_action_time(self):
@@ -522,7 +813,7 @@ class CombatComponent(Component):
         Returns:
             CombatComponent: Self for method chaining
         """
-        self.last_combat_action_time = time.time()
+        self.last_combat_action_time = _now()
         return self
     
     def time_since_last_combat_action(self):
@@ -532,7 +823,7 @@ class CombatComponent(Component):
         Returns:
             float: Time in seconds since the last combat action
         """
-        return time.time() - self.last_combat_action_time
+        return _now() - self.last_combat_action_time
     
     def time_in_combat(self):
         """
@@ -543,7 +834,7 @@ class CombatComponent(Component):
         """
         if not self.in_combat:
             return 0
-        return time.time() - self.combat_start_time
+        return _now() - self.combat_start_time
     
     def get_attack_range(self, attack_type=None):
         """
@@ -558,14 +849,7 @@ class CombatComponent(Component):
         if attack_type is None:
             attack_type = self.preferred_attack_type
         
-        if attack_type == AttackType.MELEE:
-            return self.melee_range
-        elif attack_type == AttackType.RANGED:
-            return self.ranged_range
-        elif attack_type == AttackType.SPELL:
-            return self.spell_range
-        
-        return self.melee_range
+        return self._attack_ranges[attack_type.value]
     
     def set_attack_range(self, attack_type, range_value):
         """
@@ -578,11 +862,5 @@ class CombatComponent(Component):
         Returns:
             CombatComponent: Self for method chaining
         """
-        if attack_type == AttackType.MELEE:
-            self.melee_range = range_value
-        elif attack_type == AttackType.RANGED:
-            self.ranged_range = range_value
-        elif attack_type == AttackType.SPELL:
-            self.spell_range = range_value
-        
+        self._attack_ranges[attack_type.value] = range_value
         return self 
\ No newline at end of file
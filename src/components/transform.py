@@ -4,6 +4,58 @@ Transform component for the Entity Component System.
 
 from ..ecs.component import Component
 from ..core.utils import Vector2
+from .transform_store import TRANSFORM_STORE, TransformStore
+
+class _StoreVector2(Vector2):
+    """
+    Vector2 whose coordinates live in a transform's store row.
+    
+    Reading or assigning x and y goes straight to the store columns, so
+    code that mutates a transform's position in place keeps working.
+    The view also exposes the row's height as z. Arithmetic works on the
+    ground plane and returns ordinary Vector2 instances.
+    
+    The view holds the transform itself rather than a store and row, so
+    it keeps the transform alive and follows it if its row moves.
+    """
+    
+    __slots__ = ("_transform", "_x_column", "_y_column", "_z_column")
+    
+    def __init__(self, transform, x_column, y_column, z_column):
+        self._transform = transform
+        self._x_column = x_column
+        self._y_column = y_column
+        self._z_column = z_column
+    
+    @property
+    def x(self):
+        transform = self._transform
+        return float(getattr(transform._store, self._x_column)[transform._idx])
+    
+    @x.setter
+    def x(self, value):
+        transform = self._transform
+        getattr(transform._store, self._x_column)[transform._idx] = value
+    
+    @property
+    def y(self):
+        transform = self._transform
+        return float(getattr(transform._store, self._y_column)[transform._idx])
+    
+    @y.setter
+    def y(self, value):
+        transform = self._transform
+        getattr(transform._store, self._y_column)[transform._idx] = value
+    
+    @property
+    def z(self):
+        transform = self._transform
+        return float(getattr(transform._store, self._z_column)[transform._idx])
+    
+    @z.setter
+    def z(self, value):
+        transform = self._transform
+        getattr(transform._store, self._z_column)[transform._idx] = value
 
 class TransformComponent(Component):
     """
@@ -11,8 +63,15 @@ class TransformComponent(Component):
     
     This is a fundamental component that most entities will have.
     It defines where an entity is located in the game world.
+    
+    The values are kept in a row of the shared TransformStore; the
+    component itself only holds the row index. When the component is
+    detached from its entity, its values move to a private one-row store
+    and the shared row is freed; attaching it again moves them back.
     """
     
+    __slots__ = ("_store", "_idx", "_position", "_previous_position")
+    
     def __init__(self, x=0, y=0, z=0, rotation=0, scale=1):
         """
         Initialize the transform component.
@@ -25,12 +84,132 @@ class TransformComponent(Component):
             scale: Scale factor
         """
         super().__init__()
-        self.position = Vector2(x, y)
-        self.z = z
-        self.rotation = rotation
-        self.scale = scale
-        self.previous_position = Vector2(x, y)
-        self.previous_z = z
+        store = TRANSFORM_STORE
+        index = store.allocate()
+        self._store = store
+        self._idx = index
+        
+        store.x[index] = store.prev_x[index] = x
+        store.y[index] = store.prev_y[index] = y
+        store.z[index] = store.prev_z[index] = z
+        store.rotation[index] = rotation
+        store.scale[index] = scale
+        
+        # Vector2 views over this row, created on first use
+        self._position = None
+        self._previous_position = None
+    
+    def __del__(self):
+        # Detaching frees the shared row; this only catches transforms
+        # that were never attached to an entity
+        store = getattr(self, "_store", None)
+        if store is TRANSFORM_STORE:
+            store.release(self._idx)
+    
+    def on_attach(self, entity):
+        """Called when the component is attached to an entity."""
+        super().on_attach(entity)
+        if self._store is not TRANSFORM_STORE:
+            self._move_to_store(TRANSFORM_STORE)
+    
+    def on_detach(self):
+        """Called when the component is detached from an entity."""
+        super().on_detach()
+        if self._store is TRANSFORM_STORE:
+            self._move_to_store(TransformStore(capacity=1))
+    
+    def _move_to_store(self, store):
+        """
+        Move this transform's values into another store.
+        
+        Args:
+            store: The store to move to
+        """
+        self._idx = self._store.move_row(self._idx, store)
+        self._store = store
+    
+    @property
+    def store_index(self):
+        """int: Row of this transform in the transform store."""
+        return self._idx
+    
+    @property
+    def x(self):
+        """float: X coordinate."""
+        return float(self._store.x[self._idx])
+    
+    @x.setter
+    def x(self, value):
+        self._store.x[self._idx] = value
+    
+    @property
+    def y(self):
+        """float: Y coordinate."""
+        return float(self._store.y[self._idx])
+    
+    @y.setter
+    def y(self, value):
+        self._store.y[self._idx] = value
+    
+    @property
+    def position(self):
+        """Vector2: Position view backed by the transform store."""
+        if self._position is None:
+            self._position = _StoreVector2(self, "x", "y", "z")
+        return self._position
+    
+    @position.setter
+    def position(self, value):
+        self._store.x[self._idx] = value.x
+        self._store.y[self._idx] = value.y
+    
+    @property
+    def previous_position(self):
+        """Vector2: Previous position view backed by the transform store."""
+        if self._previous_position is None:
+            self._previous_position = _StoreVector2(self, "prev_x", "prev_y", "prev_z")
+        return self._previous_position
+    
+    @previous_position.setter
+    def previous_position(self, value):
+        self._store.prev_x[self._idx] = value.x
+        self._store.prev_y[self._idx] = value.y
+    
+    @property
+    def z(self):
+        """float: Z coordinate (height)."""
+        return float(self._store.z[self._idx])
+    
+    @z.setter
+    def z(self, value):
+        self._store.z[self._idx] = value
+    
+    @property
+    def previous_z(self):
+        """float: Z coordinate before the last move."""
+        return float(self._store.prev_z[self._idx])
+    
+    @previous_z.setter
+    def previous_z(self, value):
+        self._store.prev_z[self._idx] = value
+    
+    @property
+    def rotation(self):
+        """float: Rotation in degrees."""
+        return float(self._store.rotation[self._idx])
+    
+    @rotation.setter
+    def rotation(self, value):
+        self._store.rotation[self._idx] = value
+    
+    @property
+    def scale(self):
+        """float: Scale factor."""
+        return float(self._store.scale[self._idx])
+    
+    @scale.setter
+    def scale(self, value):
+        self._store.scale[self._idx] = value
     
     def serialize(self):
         """
@@ -41,8 +220,8 @@ class TransformComponent(Component):
         """
         return {
             "position": {
-                "x": self.position.x,
-                "y": self.position.y
+                "x": self.x,
+                "y": self.y
             },
             "z": self.z,
             "rotation": self.rotation,
@@ -69,6 +248,28 @@ class TransformComponent(Component):
         
         return cls(x, y, z, rotation, scale)
     
+    def clone(self):
+        """
+        Create a copy of this component.
+        
+        Reads the store row directly instead of round-tripping
+        through serialize() and deserialize().
+        
+        Returns:
+            TransformComponent: New component instance with the same data
+        """
+        store = self._store
+        index = self._idx
+        return self.__class__(store.x[index], store.y[index], store.z[index],
+                              store.rotation[index], store.scale[index])
+    
+    def __copy__(self):
+        # The default copy would share this component's store row
+        return self.clone()
+    
+    def __deepcopy__(self, memo):
+        return self.clone()
+    
     def set_position(self, x, y, z=None):
         """
         Set the position.
@@ -81,15 +282,18 @@ class TransformComponent(Component):
         Returns:
             TransformComponent: Self for method chaining
         """
-        self.previous_position.x = self.position.x
-        self.previous_position.y = self.position.y
+        store = self._store
+        index = self._idx
+        
+        store.prev_x[index] = store.x[index]
+        store.prev_y[index] = store.y[index]
         
-        self.position.x = x
-        self.position.y = y
+        store.x[index] = x
+        store.y[index] = y
         
         if z is not None:
-            self.previous_z = self.z
-            self.z = z
+            store.prev_z[index] = store.z[index]
+            store.z[index] = z
         
         return self
     
@@ -131,15 +335,18 @@ class TransformComponent(Component):
         Returns:
             TransformComponent: Self for method chaining
         """
-        self.previous_position.x = self.position.x
-        self.previous_position.y = self.position.y
+        store = self._store
+        index = self._idx
+        
+        store.prev_x[index] = store.x[index]
+        store.prev_y[index] = store.y[index]
         
-        self.position.x += dx
-        self.position.y += dy
+        store.x[index] += dx
+        store.y[index] += dy
         
         if dz != 0:
-            self.previous_z = self.z
-            self.z += dz
+            store.prev_z[index] = store.z[index]
+            store.z[index] += dz
         
         return self
     
@@ -176,9 +383,11 @@ class TransformComponent(Component):
         Returns:
             bool: True if moved, False otherwise
         """
-        return (self.position.x != self.previous_position.x or
-                self.position.y != self.previous_position.y or
-                self.z != self.previous_z)
+        store = self._store
+        index = self._idx
+        return bool(store.x[index] != store.prev_x[index] or
+                    store.y[index] != store.prev_y[index] or
+                    store.z[index] != store.prev_z[index])
     
     def update_previous_position(self):
         """
@@ -187,11 +396,9 @@ class TransformComponent(Component):
         Returns:
             TransformComponent: Self for method chaining
         """
-        self.previous_position.x = self.position.x
-        self.previous_position.y = self.position.y
-        self.previous_z = self.z
-<<<<<<< HEAD
+        store = self._store
+        index = self._idx
+        store.prev_x[index] = store.x[index]
+        store.prev_y[index] = store.y[index]
+        store.prev_z[index] = store.z[index]
         return self
-=======
-        return self 
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
@@ -0,0 +1,62 @@
+"""
+Batched distance math over transform store columns.
+
+These helpers replace per-pair distance loops with whole-array NumPy
+operations. Distances are kept squared so callers can compare them
+against a squared range and skip the square root entirely.
+"""
+
+import numpy as np
+
+from .transform_store import TRANSFORM_STORE
+
+def gather_positions(transforms, store=TRANSFORM_STORE):
+    """
+    Copy the positions of several transforms into an (N, 3) array.
+    
+    Args:
+        transforms: Sequence of TransformComponent instances
+        store: Transform store the components live in
+    
+    Returns:
+        numpy.ndarray: Array of (x, y, z) rows in the order given
+    """
+    rows = np.fromiter((transform.store_index for transform in transforms),
+                       dtype=np.intp, count=len(transforms))
+    positions = np.empty((len(rows), 3), dtype=store.x.dtype)
+    np.take(store.x, rows, out=positions[:, 0])
+    np.take(store.y, rows, out=positions[:, 1])
+    np.take(store.z, rows, out=positions[:, 2])
+    return positions
+
+def pairwise_sq_dist_xy(x, y):
+    """
+    Squared ground-plane distance between every pair of points.
+    
+    Args:
+        x: Array of X coordinates
+        y: Array of Y coordinates
+    
+    Returns:
+        numpy.ndarray: N x N matrix of squared distances
+    """
+    distances = np.subtract.outer(x, x)
+    distances *= distances
+    dy = np.subtract.outer(y, y)
+    dy *= dy
+    distances += dy
+    return distances
+
+def batch_distance(a, b):
+    """
+    Euclidean distance between matching rows of two point arrays.
+    
+    Args:
+        a: (N, D) array of points
+        b: (N, D) array of points, or a single (D,) point to measure from
+    
+    Returns:
+        numpy.ndarray: Array of N distances
+    """
+    delta = a - b
+    return np.sqrt(np.einsum("ij,ij->i", delta, delta))
@@ -0,0 +1,127 @@
+"""
+Structure-of-arrays storage for transform data.
+
+Every TransformComponent owns one row in the shared store. Keeping each
+field in its own contiguous array lets systems process all transforms
+with whole-array NumPy operations instead of per-entity attribute access.
+"""
+
+import numpy as np
+
+# Columns held by the store, with the value a freshly allocated row starts at
+_COLUMNS = (
+    ("x", 0.0),
+    ("y", 0.0),
+    ("z", 0.0),
+    ("rotation", 0.0),
+    ("scale", 1.0),
+    ("prev_x", 0.0),
+    ("prev_y", 0.0),
+    ("prev_z", 0.0),
+)
+
+class TransformStore:
+    """
+    Column storage for position, rotation and scale of every transform.
+    
+    Rows are handed out by allocate() and returned with release(). Released
+    rows are reused before the store grows, so the arrays stay dense.
+    """
+    
+    def __init__(self, capacity=1024):
+        """
+        Initialize the transform store.
+        
+        Args:
+            capacity: Number of rows to preallocate
+        """
+        self.capacity = capacity
+        for name, default in _COLUMNS:
+            setattr(self, name, np.full(capacity, default, dtype=np.float64))
+        
+        # Rows in use are [0, size); freed rows below size are reused first
+        self.size = 0
+        self._free_rows = []
+    
+    def allocate(self):
+        """
+        Reserve a row for a new transform.
+        
+        Returns:
+            int: Index of the reserved row
+        """
+        if self._free_rows:
+            return self._free_rows.pop()
+        
+        if self.size == self.capacity:
+            self._grow(self.capacity * 2)
+        
+        index = self.size
+        self.size += 1
+        return index
+    
+    def release(self, index):
+        """
+        Return a row to the store for reuse.
+        
+        Args:
+            index: Row index previously returned by allocate()
+        """
+        for name, default in _COLUMNS:
+            getattr(self, name)[index] = default
+        self._free_rows.append(index)
+    
+    def move_row(self, index, target):
+        """
+        Move a row's values into another store and free the row here.
+        
+        Args:
+            index: Row index in this store
+            target: Store to move the values into
+            
+        Returns:
+            int: Index of the row in the target store
+        """
+        new_index = target.allocate()
+        for name, _ in _COLUMNS:
+            getattr(target, name)[new_index] = getattr(self, name)[index]
+        self.release(index)
+        return new_index
+    
+    def moved_mask(self):
+        """
+        Get a mask of rows that moved since their previous position was stored.
+        
+        Returns:
+            numpy.ndarray: Boolean array over the rows in use
+        """
+        # Whole-column NumPy operations; a numba loop fusing the three
+        # comparisons (or the three copies below) measured no faster at
+        # 10k rows, so these bulk passes stay in NumPy
+        size = self.size
+        return ((self.x[:size] != self.prev_x[:size]) |
+                (self.y[:size] != self.prev_y[:size]) |
+                (self.z[:size] != self.prev_z[:size]))
+    
+    def update_previous_positions(self):
+        """Store the current position of every row as its previous position."""
+        size = self.size
+        self.prev_x[:size] = self.x[:size]
+        self.prev_y[:size] = self.y[:size]
+        self.prev_z[:size] = self.z[:size]
+    
+    def _grow(self, capacity):
+        """
+        Enlarge every column to a new capacity.
+        
+        Args:
+            capacity: New number of rows
+        """
+        for name, default in _COLUMNS:
+            column = np.full(capacity, default, dtype=np.float64)
+            column[:self.capacity] = getattr(self, name)
+            setattr(self, name, column)
+        self.capacity = capacity
+
+# Shared store used by every TransformComponent
+TRANSFORM_STORE = TransformStore()
@@ -1,7 +1,3 @@
 """
 Core module for game architecture.
-<<<<<<< HEAD
 """
-=======
-""" 
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
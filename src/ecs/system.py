@@ -2,38 +2,50 @@
 System base class for the Entity Component System.
 """
 
+from .entity import component_mask
+
 class System:
     """
     Base class for all systems in the ECS.
-<<<<<<< HEAD
 
     Systems contain the logic to process entities with specific components.
     They are responsible for implementing game behavior and mechanics.
+
+    The base attributes live in __slots__; subclasses that don't declare
+    their own __slots__ keep a __dict__ for their extra state.
     """
 
-    def __init__(self, world):
-        """
-        Initialize the system.
+    __slots__ = ("world", "required_components", "enabled", "priority",
+                 "primary_component", "reads", "writes", "parallel", "_required_mask", "_cached_version", "_cached_entities")
 
-=======
-    
-    Systems contain the logic to process entities with specific components.
-    They are responsible for implementing game behavior and mechanics.
-    """
-    
     def __init__(self, world):
         """
         Initialize the system.
-        
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
+
         Args:
             world: The world this system belongs to
         """
         self.world = world
-        self.required_components = set()  # Component types required for processing
+        self.required_components = frozenset()  # Component types required for processing
         self.enabled = True  # Whether the system is enabled
         self.priority = 0  # Execution priority (higher = earlier)
-<<<<<<< HEAD
+        self.primary_component = None  # Component type the system mostly works on, or None for the first required one
+
+        # Opt-in concurrency: systems with parallel set run on the world's
+        # thread pool alongside neighbouring parallel systems whose reads
+        # and writes don't overlap theirs. Worthwhile when the work happens
+        # in NumPy or other native code that releases the GIL.
+        self.reads = frozenset()  # Component types the system reads
+        self.writes = frozenset()  # Component types the system modifies
+        self.parallel = False  # Whether the system may run on a worker thread
+
+        # Signature mask of required_components, frozen at the first query
+        self._required_mask = None
+
+        # Result of the last get_entities() call and the world's structural
+        # version it was computed at
+        self._cached_version = -1
+        self._cached_entities = None
 
     def initialize(self):
         """
@@ -55,59 +67,32 @@ class System:
         """
         Update the system.
 
-=======
-    
-    def initialize(self):
-        """
-        Initialize the system. Called when the system is added to the world.
-        
-        Override this method to perform setup tasks.
-        """
-        pass
-    
-    def shutdown(self):
-        """
-        Shutdown the system. Called when the system is removed from the world.
-        
-        Override this method to perform cleanup tasks.
-        """
-        pass
-    
-    def update(self, dt):
-        """
-        Update the system.
-        
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
+        Subclasses normally override process() rather than this method;
+        it is skipped on frames with no matching entities.
+
         Args:
             dt: Delta time in seconds
         """
-        if not self.enabled:
+        if not self.enabled or not self.required_components:
             return
-<<<<<<< HEAD
 
-        # Get entities that match the required components
-        entities = self.get_entities()
+        # Get entities that match the required components; this is
+        # get_entities() inlined, since it runs for every system every frame
+        world = self.world
+        version = world.structural_version
+        if version != self._cached_version:
+            self._cached_entities = world.get_entities_with_components(self._get_required_mask())
+            self._cached_version = version
+        entities = self._cached_entities
 
         # Process the entities
-        self.process(entities, dt)
+        if entities:
+            self.process(entities, dt)
 
     def process(self, entities, dt):
         """
         Process the entities.
 
-=======
-        
-        # Get entities that match the required components
-        entities = self.get_entities()
-        
-        # Process the entities
-        self.process(entities, dt)
-    
-    def process(self, entities, dt):
-        """
-        Process the entities.
-        
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
         Args:
             entities: List of entities to process
             dt: Delta time in seconds
@@ -115,69 +100,126 @@ class System:
         # Base implementation does nothing
         # Subclasses should override this to implement their logic
         pass
-<<<<<<< HEAD
 
     def get_entities(self):
         """
         Get entities that match the required components.
 
-=======
-    
-    def get_entities(self):
-        """
-        Get entities that match the required components.
-        
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
+        The result is reused until an entity's components change, so it
+        must not be modified. For systems that override update().
+
         Returns:
             list: List of matching entities
         """
         if not self.required_components:
             return []
-<<<<<<< HEAD
 
-        return self.world.get_entities_with_components(self.required_components)
+        # Reuse the last result until an entity's components change
+        world = self.world
+        if world.structural_version != self._cached_version:
+            self._cached_entities = world.get_entities_with_components(self._get_required_mask())
+            self._cached_version = world.structural_version
+        return self._cached_entities
 
-    def enable(self):
-        """Enable the system."""
-        self.enabled = True
+    def get_archetypes(self):
+        """
+        Get the archetype tables that hold the required components.
 
-    def disable(self):
-        """Disable the system."""
-        self.enabled = False
+        Iterating the tables' columns visits every matching entity's
+        components without looking each one up on its entity.
 
-    def set_priority(self, priority):
+        Returns:
+            list: List of matching archetypes
         """
-        Set the execution priority of the system.
+        if not self.required_components:
+            return []
+
+        return self.world.get_archetypes_with_components(self._get_required_mask())
+
+    def _get_required_mask(self):
+        """
+        Get the signature mask of the required components.
+
+        The mask is computed once, so required_components should be set
+        before the system first queries the world, or changed later through
+        set_required_components().
+
+        Returns:
+            int: Mask from component_mask()
+        """
+        mask = self._required_mask
+        if mask is None:
+            mask = self._required_mask = component_mask(self.required_components)
+        return mask
+
+    def set_required_components(self, component_types):
+        """
+        Set the component types required for processing.
+
+        Args:
+            component_types: Collection of component types
+
+        Returns:
+            System: Self for method chaining
+        """
+        self.required_components = frozenset(component_types)
+
+        # Recompute the mask and re-query on next use
+        self._required_mask = None
+        self._cached_version = -1
+        self._cached_entities = None
+        return self
+
+    def get_primary_component(self):
+        """
+        Get the component type the system mostly works on.
+
+        Systems with the same priority and primary component are run back
+        to back, so the data they share is still warm for the later ones.
+        Without an explicit primary_component, the required type with the
+        first name is used; set iteration order changes between runs, so
+        it can't be relied on.
+
+        Returns:
+            type: The primary component type, or None if the system has none
+        """
+        if self.primary_component is not None:
+            return self.primary_component
+        if not self.required_components:
+            return None
+        return min(self.required_components,
+                   key=lambda component_type: (component_type.__name__, component_type.__module__))
+
+    def conflicts_with(self, other):
+        """
+        Check if this system and another touch the same data unsafely.
+
+        Args:
+            other: The other system
+
+        Returns:
+            bool: True if either one writes a component type the other uses
+        """
+        return bool(self.writes & (other.reads | other.writes) or
+                    other.writes & self.reads)
 
-=======
-        
-        return self.world.get_entities_with_components(self.required_components)
-    
     def enable(self):
         """Enable the system."""
         self.enabled = True
-    
+
     def disable(self):
         """Disable the system."""
         self.enabled = False
-    
+
     def set_priority(self, priority):
         """
         Set the execution priority of the system.
-        
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
+
         Args:
             priority: Priority value (higher = earlier execution)
         """
         self.priority = priority
-<<<<<<< HEAD
 
-        # Notify world to resort systems
-        if self.world:
-            self.world.sort_systems()
-=======
-        
-        # Notify world to resort systems
+        # Notify world to resort systems before its next update
         if self.world:
-            self.world.sort_systems() 
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
+            self.world.invalidate_system_order()
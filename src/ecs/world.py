@@ -2,103 +2,138 @@
 World class for the Entity Component System.
 """
 
+import os
+import threading
 from collections import defaultdict
-from .entity import Entity
+from concurrent.futures import ThreadPoolExecutor
+from .archetype import Archetype
+from .entity import Entity, component_mask
+from .sparse_set import SparseSet
+from ..core import tick_clock
 from ..events.event_types import EventType
 
 class World:
     """
     World class that manages entities and systems.
-<<<<<<< HEAD
 
     The World is the main container for the ECS. It keeps track of all
     entities and systems, and handles their creation, destruction, and updates.
     """
 
-    def __init__(self, event_manager):
-        """
-        Initialize the world.
+    # Most destroyed entities kept for reuse
+    MAX_POOLED_ENTITIES = 1024
+
+    # Worker threads used to run parallel systems
+    MAX_SYSTEM_WORKERS = os.cpu_count() or 1
 
-=======
-    
-    The World is the main container for the ECS. It keeps track of all
-    entities and systems, and handles their creation, destruction, and updates.
-    """
-    
     def __init__(self, event_manager):
         """
         Initialize the world.
-        
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
+
         Args:
             event_manager: Event manager for emitting events
         """
-        self.entities = {}  # Entity ID -> Entity
+        # Entity ID -> Entity. Kept a dict: a SparseSet index measured 2-3x
+        # slower for membership tests and lookups, and no faster to iterate
+        self.entities = {}
         self.systems = []  # List of systems
-        self.component_entities = defaultdict(set)  # Component type -> Set of entity IDs
+        self._systems_dirty = False  # Whether systems must be re-sorted before the next update
+        self._system_order = {}  # System -> Number in the order systems were added
+        self._systems_added = 0  # Systems added so far, used to number them
+        self._executor = None  # Thread pool for parallel systems, created when first needed
+        self._query_lock = threading.Lock()  # Guards query cache misses made from worker threads
+        self.sparse_sets = defaultdict(SparseSet)  # Component type -> SparseSet of components
         self.tag_entities = defaultdict(set)  # Tag -> Set of entity IDs
+        self.archetypes = {}  # Component signature mask -> Archetype
+        self.entity_locations = {}  # Entity ID -> (Archetype, row)
+        self._archetype_queries = {}  # Required signature mask -> List of matching archetypes
+        self.structural_version = 0  # Bumped whenever an entity's component set or membership changes
+        self._entity_queries = {}  # Required signature mask -> (Archetype version sum, List of matching entities)
         self.event_manager = event_manager
         self.component_registry = {}  # Component name -> Component class
         self.pending_entities = []  # Entities to be added next update
         self.pending_removals = []  # Entities to be removed next update
+        self._entity_pool = []  # Destroyed entities waiting to be reused
         self.current_map_id = None  # Current map ID
         self.game_time = 0.0  # Game time in seconds
         self.flags = {}  # Global game flags
-<<<<<<< HEAD
 
     def register_component(self, component_class):
         """
         Register a component class with the world.
 
-=======
-    
-    def register_component(self, component_class):
-        """
-        Register a component class with the world.
-        
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
         Args:
             component_class: The component class to register
         """
         self.component_registry[component_class.__name__] = component_class
-<<<<<<< HEAD
 
     def create_entity(self):
         """
         Create a new entity.
 
-=======
-    
-    def create_entity(self):
+        Returns:
+            Entity: The created entity
         """
-        Create a new entity.
-        
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
+        entity = self._new_entity()
+        self.pending_entities.append(entity)
+        return entity
+
+    def spawn(self, components):
+        """
+        Create a new entity that already has a set of components.
+
+        The components are attached before the entity reaches the world, so
+        it is placed straight into its final archetype table when it is
+        added, instead of moving once per component. No COMPONENT_ADDED
+        events are emitted; the ENTITY_CREATED event carries the entity
+        with all of its components.
+
+        Args:
+            components: Components to give the entity
+
         Returns:
             Entity: The created entity
         """
-        entity = Entity(self)
+        entity = self._new_entity()
+        for component in components:
+            entity._attach(component)
         self.pending_entities.append(entity)
         return entity
-<<<<<<< HEAD
 
-    def destroy_entity(self, entity):
+    def add_entities(self, component_lists):
         """
-        Destroy an entity.
+        Create several entities, each with its own set of components.
+
+        Args:
+            component_lists: One collection of components per entity
+
+        Returns:
+            list: The created entities
+        """
+        return [self.spawn(components) for components in component_lists]
+
+    def _new_entity(self):
+        """
+        Take an entity from the pool, or create one if the pool is empty.
+
+        Returns:
+            Entity: An entity with a new ID and no components or tags
+        """
+        if self._entity_pool:
+            entity = self._entity_pool.pop()
+            entity._recycle(self)
+            return entity
+        return Entity(self)
 
-=======
-    
     def destroy_entity(self, entity):
         """
         Destroy an entity.
-        
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
+
         Args:
             entity: The entity to destroy
         """
         if entity.id in self.entities:
             self.pending_removals.append(entity)
-<<<<<<< HEAD
 
     def add_system(self, system):
         """
@@ -107,24 +142,15 @@ class World:
         Args:
             system: The system to add
 
-=======
-    
-    def add_system(self, system):
-        """
-        Add a system to the world.
-        
-        Args:
-            system: The system to add
-            
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
         Returns:
             System: The added system
         """
         self.systems.append(system)
-        self.sort_systems()
+        self._system_order[system] = self._systems_added
+        self._systems_added += 1
+        self.invalidate_system_order()
         system.initialize()
         return system
-<<<<<<< HEAD
 
     def remove_system(self, system):
         """
@@ -133,98 +159,134 @@ class World:
         Args:
             system: The system to remove
 
-=======
-    
-    def remove_system(self, system):
-        """
-        Remove a system from the world.
-        
-        Args:
-            system: The system to remove
-            
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
         Returns:
             System: The removed system, or None if not found
         """
         if system in self.systems:
             system.shutdown()
             self.systems.remove(system)
+            self._system_order.pop(system, None)
             return system
         return None
-<<<<<<< HEAD
 
     def sort_systems(self):
-        """Sort systems by priority."""
-        self.systems.sort(key=lambda s: s.priority, reverse=True)
+        """
+        Sort systems by priority.
 
-    def update(self, dt):
+        Within a priority, systems that share a primary component are kept
+        together. Groups, and systems inside a group, keep the order they
+        were added in.
         """
-        Update the world.
+        system_order = self._system_order
+
+        # Each group is placed where its earliest-added system would be
+        group_order = {}
+        for system in self.systems:
+            group = (system.priority, system.get_primary_component())
+            order = system_order[system]
+            if order < group_order.get(group, order + 1):
+                group_order[group] = order
+
+        self.systems.sort(key=lambda system: (
+            -system.priority,
+            group_order[system.priority, system.get_primary_component()],
+            system_order[system]
+        ))
+        self._systems_dirty = False
+
+    def invalidate_system_order(self):
+        """Re-sort systems by priority before the next update."""
+        self._systems_dirty = True
 
-=======
-    
-    def sort_systems(self):
-        """Sort systems by priority."""
-        self.systems.sort(key=lambda s: s.priority, reverse=True)
-    
     def update(self, dt):
         """
         Update the world.
-        
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
+
         Args:
             dt: Delta time in seconds
         """
+        # Capture the tick time once for every system this frame
+        tick_clock.advance()
+
         # Update game time
         self.game_time += dt
-<<<<<<< HEAD
 
-=======
-        
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
         # Process pending entity additions
         for entity in self.pending_entities:
             self._add_entity(entity)
         self.pending_entities.clear()
-<<<<<<< HEAD
 
-=======
-        
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
         # Process pending entity removals
         for entity in self.pending_removals:
             self._remove_entity(entity)
         self.pending_removals.clear()
-<<<<<<< HEAD
 
-        # Update all systems
+        # Apply any priority changes made since the last update
+        if self._systems_dirty:
+            self.sort_systems()
+
+        # Update all systems. Consecutive parallel systems that don't
+        # conflict are collected into a wave and run together.
+        wave = []
         for system in self.systems:
-            system.update(dt)
+            if wave and (not system.parallel or
+                         any(system.conflicts_with(other) for other in wave)):
+                self._run_systems(wave, dt)
+                wave = []
 
-    def _add_entity(self, entity):
+            if system.parallel:
+                wave.append(system)
+            else:
+                system.update(dt)
+        self._run_systems(wave, dt)
+
+    def _run_systems(self, systems, dt):
         """
-        Add an entity to the world.
+        Update a wave of non-conflicting parallel systems.
+
+        Args:
+            systems: The systems to update
+            dt: Delta time in seconds
+        """
+        if not systems:
+            return
+
+        if len(systems) == 1:
+            systems[0].update(dt)
+            return
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.MAX_SYSTEM_WORKERS)
+
+        # Fill the systems' query caches on this thread, so the workers
+        # normally only read them
+        for system in systems:
+            system.get_entities()
+
+        # Wait for the whole wave; list() also re-raises a system's error
+        list(self._executor.map(lambda system: system.update(dt), systems))
+
+    def shutdown(self):
+        """Stop the worker threads used for parallel systems."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
 
-=======
-        
-        # Update all systems
-        for system in self.systems:
-            system.update(dt)
-    
     def _add_entity(self, entity):
         """
         Add an entity to the world.
-        
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
+
         Args:
             entity: The entity to add
         """
         self.entities[entity.id] = entity
-<<<<<<< HEAD
+
+        # Store the entity's components in its archetype table
+        self.move_entity(entity)
 
         # Add to component indices
         for component_type, component in entity.components.items():
-            self.component_entities[component_type].add(entity.id)
+            self.sparse_sets[component_type].insert(entity.id, component)
 
         # Add to tag indices
         for tag in entity.tags:
@@ -237,115 +299,129 @@ class World:
         """
         Remove an entity from the world.
 
-=======
-        
-        # Add to component indices
-        for component_type, component in entity.components.items():
-            self.component_entities[component_type].add(entity.id)
-        
-        # Add to tag indices
-        for tag in entity.tags:
-            self.tag_entities[tag].add(entity.id)
-        
-        # Emit entity created event
-        self.event_manager.emit(EventType.ENTITY_CREATED, {"entity": entity})
-    
-    def _remove_entity(self, entity):
-        """
-        Remove an entity from the world.
-        
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
         Args:
             entity: The entity to remove
         """
         # Emit entity destroyed event
         self.event_manager.emit(EventType.ENTITY_DESTROYED, {"entity": entity})
-<<<<<<< HEAD
 
-=======
-        
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
         # Remove from component indices
         for component_type in entity.components:
-            if entity.id in self.component_entities[component_type]:
-                self.component_entities[component_type].remove(entity.id)
-<<<<<<< HEAD
+            self.sparse_sets[component_type].remove(entity.id)
 
-=======
-        
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
         # Remove from tag indices
         for tag in entity.tags:
             if entity.id in self.tag_entities[tag]:
                 self.tag_entities[tag].remove(entity.id)
-<<<<<<< HEAD
 
-        # Remove from entities dict
-        if entity.id in self.entities:
-            del self.entities[entity.id]
+        # Remove from its archetype table
+        self._remove_from_archetype(entity.id)
+        self.structural_version += 1
 
-    def on_component_added(self, entity, component):
+        # Remove from entities dict and keep the object for reuse. The same
+        # entity can be queued for removal twice; only the first one pools it.
+        # References kept to a destroyed entity must not be used afterwards.
+        if self.entities.pop(entity.id, None) is not None:
+            entity._reset()
+            if len(self._entity_pool) < self.MAX_POOLED_ENTITIES:
+                self._entity_pool.append(entity)
+
+    def move_entity(self, entity):
         """
-        Called when a component is added to an entity.
+        Move an entity to the archetype table matching its current components.
+
+        Called whenever an entity gains or loses a component. Entities that
+        have not been added to the world yet are placed when they are added.
+
+        Args:
+            entity: The entity to move
+        """
+        # Entities not added yet, or stale copies sharing a live entity's
+        # ID, must not touch the live entity's row
+        if self.entities.get(entity.id) is not entity:
+            return
+
+        self._remove_from_archetype(entity.id)
+        self.structural_version += 1
+
+        archetype = self._get_archetype(entity.signature, entity.components)
+        row = archetype.append(entity)
+        self.entity_locations[entity.id] = (archetype, row)
+
+    def _remove_from_archetype(self, entity_id):
+        """
+        Remove an entity's row from its archetype table, if it has one.
+
+        Args:
+            entity_id: The ID of the entity to remove
+        """
+        location = self.entity_locations.pop(entity_id, None)
+        if location is None:
+            return
+
+        archetype, row = location
+        moved_entity = archetype.swap_remove(row)
+        if moved_entity is not None:
+            self.entity_locations[moved_entity.id] = (archetype, row)
+
+    def _get_archetype(self, signature, component_types):
+        """
+        Get the archetype for a set of component types, creating it if needed.
+
+        Args:
+            signature: Signature mask of the component types
+            component_types: Collection of the component types
+
+        Returns:
+            Archetype: The archetype table
+        """
+        archetype = self.archetypes.get(signature)
+        if archetype is None:
+            archetype = Archetype(component_types)
+            self.archetypes[signature] = archetype
+
+            # Add the new table to the cached queries it matches
+            for required_mask, matching in self._archetype_queries.items():
+                if archetype.matches(required_mask):
+                    matching.append(archetype)
+
+        return archetype
 
-=======
-        
-        # Remove from entities dict
-        if entity.id in self.entities:
-            del self.entities[entity.id]
-    
     def on_component_added(self, entity, component):
         """
         Called when a component is added to an entity.
-        
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
+
         Args:
             entity: The entity the component was added to
             component: The component that was added
         """
-        component_type = component.__class__
-        self.component_entities[component_type].add(entity.id)
-<<<<<<< HEAD
+        # Only entities in the world are indexed; pending entities get all
+        # of their components indexed when they are added
+        if self.entities.get(entity.id) is entity:
+            self.sparse_sets[component.__class__].insert(entity.id, component)
 
-=======
-        
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
         # Emit component added event
         self.event_manager.emit(EventType.COMPONENT_ADDED, {
             "entity": entity,
             "component": component
         })
-<<<<<<< HEAD
 
     def on_component_removed(self, entity, component):
         """
         Called when a component is removed from an entity.
 
-=======
-    
-    def on_component_removed(self, entity, component):
-        """
-        Called when a component is removed from an entity.
-        
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
         Args:
             entity: The entity the component was removed from
             component: The component that was removed
         """
-        component_type = component.__class__
-        if entity.id in self.component_entities[component_type]:
-            self.component_entities[component_type].remove(entity.id)
-<<<<<<< HEAD
+        if self.entities.get(entity.id) is entity:
+            self.sparse_sets[component.__class__].remove(entity.id)
 
-=======
-        
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
         # Emit component removed event
         self.event_manager.emit(EventType.COMPONENT_REMOVED, {
             "entity": entity,
             "component": component
         })
-<<<<<<< HEAD
 
     def get_entity(self, entity_id):
         """
@@ -354,118 +430,207 @@ class World:
         Args:
             entity_id: The ID of the entity to get
 
-=======
-    
-    def get_entity(self, entity_id):
-        """
-        Get an entity by ID.
-        
-        Args:
-            entity_id: The ID of the entity to get
-            
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
         Returns:
             Entity: The entity, or None if not found
         """
         return self.entities.get(entity_id)
-<<<<<<< HEAD
 
-    def get_entities_with_component(self, component_type):
+    def is_alive(self, entity_id):
         """
-        Get all entities with a specific component type.
+        Check if an entity ID still refers to an entity in the world.
+
+        IDs are never handed out twice, even when a destroyed entity's
+        object is reused, so holding on to an ID is always safe.
 
         Args:
-            component_type: The component type to filter by
+            entity_id: The ID of the entity to check
 
         Returns:
-            list: List of matching entities
+            bool: True if the entity is in the world, False otherwise
         """
-        return [self.entities[entity_id] for entity_id in self.component_entities[component_type]  
-                if entity_id in self.entities]
+        return entity_id in self.entities
 
-    def get_entities_with_components(self, component_types):
+    def get_component(self, entity_id, component_type):
         """
-        Get all entities with all of the specified component types.
+        Get an entity's component of the specified type.
 
         Args:
-            component_types: Collection of component types to filter by
+            entity_id: The ID of the entity
+            component_type: The type of component to get
+
+        Returns:
+            Component: The component, or None if not found
+        """
+        sparse_set = self.sparse_sets.get(component_type)
+        if sparse_set is None:
+            return None
+        return sparse_set.get(entity_id)
+
+    def has_component(self, entity_id, component_type):
+        """
+        Check if an entity has a component of the specified type.
+
+        Args:
+            entity_id: The ID of the entity
+            component_type: The type of component to check for
+
+        Returns:
+            bool: True if the entity has the component, False otherwise
+        """
+        sparse_set = self.sparse_sets.get(component_type)
+        return sparse_set is not None and entity_id in sparse_set
+
+    def get_components(self, component_type):
+        """
+        Get every component of a type, packed with no gaps.
+
+        Args:
+            component_type: The component type to get
+
+        Returns:
+            list: The components; the list is shared and must not be modified
+        """
+        sparse_set = self.sparse_sets.get(component_type)
+        if sparse_set is None:
+            return []
+        return sparse_set.dense
 
-=======
-    
     def get_entities_with_component(self, component_type):
         """
         Get all entities with a specific component type.
-        
+
         Args:
             component_type: The component type to filter by
-            
+
         Returns:
             list: List of matching entities
         """
-        return [self.entities[entity_id] for entity_id in self.component_entities[component_type]
-                if entity_id in self.entities]
-    
+        sparse_set = self.sparse_sets.get(component_type)
+        if sparse_set is None:
+            return []
+
+        # Sparse sets only hold entities in the world, so no filter is needed
+        entities = self.entities
+        return [entities[entity_id] for entity_id in sparse_set.entities]
+
     def get_entities_with_components(self, component_types):
         """
         Get all entities with all of the specified component types.
-        
+
+        Results are cached until an entity joins or leaves one of the
+        matching archetype tables, so the returned list must not be modified.
+
         Args:
-            component_types: Collection of component types to filter by
-            
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
+            component_types: Collection of component types to filter by, or
+                a mask from component_mask()
+
         Returns:
             list: List of matching entities
         """
         if not component_types:
             return []
-<<<<<<< HEAD
-
-=======
-        
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
-        # Start with entities that have the first component type
-        component_types = list(component_types)
-        first_type = component_types[0]
-        entity_ids = set(self.component_entities[first_type])
-<<<<<<< HEAD
-
-        # Filter by remaining component types
-        for component_type in component_types[1:]:
-            entity_ids &= set(self.component_entities[component_type])
-
-        return [self.entities[entity_id] for entity_id in entity_ids
-                if entity_id in self.entities]
 
-    def get_entities_with_tag(self, tag):
+        required_mask = component_mask(component_types)
+        archetypes = self.get_archetypes_with_components(required_mask)
+
+        # Table versions only grow, so the sum stays the same only while no
+        # matching table has gained or lost a row; changes to other tables
+        # leave the cached result alone
+        version = sum(archetype.version for archetype in archetypes)
+        cached = self._entity_queries.get(required_mask)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        with self._query_lock:
+            # Another thread may have filled the entry while this one waited
+            cached = self._entity_queries.get(required_mask)
+            if cached is not None and cached[0] == version:
+                return cached[1]
+
+            # Every entity in a matching archetype table has all of the types
+            entities = []
+            for archetype in archetypes:
+                entities.extend(archetype.entities)
+            self._entity_queries[required_mask] = (version, entities)
+        return entities
+
+    def iter_entities_with_components(self, component_types):
         """
-        Get all entities with a specific tag.
+        Iterate all entities with all of the specified component types.
+
+        Unlike get_entities_with_components(), no list is built or cached,
+        which suits one-off passes. Entities must not gain or lose
+        components while the iteration is running.
 
         Args:
-            tag: The tag to filter by
+            component_types: Collection of component types to filter by, or
+                a mask from component_mask()
+
+        Yields:
+            Entity: Each matching entity
+        """
+        if not component_types:
+            return
+
+        for archetype in self.get_archetypes_with_components(component_types):
+            yield from archetype.entities
+
+    def iter_components(self, *component_types):
+        """
+        Iterate the components of every entity that has all of the types.
+
+        Walks the matching archetype tables column by column, without
+        looking anything up on the entities. Entities must not gain or lose
+        components while the iteration is running.
+
+        Args:
+            *component_types: The component types to get
+
+        Yields:
+            tuple: One component of each requested type, in the order given
+        """
+        if not component_types:
+            return
+
+        for archetype in self.get_archetypes_with_components(component_types):
+            columns = archetype.columns
+            yield from zip(*[columns[component_type] for component_type in component_types])
+
+    def get_archetypes_with_components(self, component_types):
+        """
+        Get the archetype tables that store all of the specified component types.
+
+        Args:
+            component_types: Collection of component types to filter by, or
+                a mask from component_mask()
+
+        Returns:
+            list: List of matching archetypes; the list is cached and must
+            not be modified
+        """
+        required_mask = component_mask(component_types)
+        matching = self._archetype_queries.get(required_mask)
+        if matching is None:
+            with self._query_lock:
+                matching = self._archetype_queries.get(required_mask)
+                if matching is None:
+                    matching = [archetype for archetype in self.archetypes.values()
+                                if archetype.matches(required_mask)]
+                    self._archetype_queries[required_mask] = matching
+        return matching
 
-=======
-        
-        # Filter by remaining component types
-        for component_type in component_types[1:]:
-            entity_ids &= set(self.component_entities[component_type])
-        
-        return [self.entities[entity_id] for entity_id in entity_ids
-                if entity_id in self.entities]
-    
     def get_entities_with_tag(self, tag):
         """
         Get all entities with a specific tag.
-        
+
         Args:
             tag: The tag to filter by
-            
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
+
         Returns:
             list: List of matching entities
         """
         return [self.entities[entity_id] for entity_id in self.tag_entities[tag]
                 if entity_id in self.entities]
-<<<<<<< HEAD
 
     def get_entities_with_tags(self, tags):
         """
@@ -474,73 +639,40 @@ class World:
         Args:
             tags: Collection of tags to filter by
 
-=======
-    
-    def get_entities_with_tags(self, tags):
-        """
-        Get all entities with all of the specified tags.
-        
-        Args:
-            tags: Collection of tags to filter by
-            
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
         Returns:
             list: List of matching entities
         """
         if not tags:
             return []
-<<<<<<< HEAD
-
-=======
-        
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
-        # Start with entities that have the first tag
-        tags = list(tags)
-        first_tag = tags[0]
-        entity_ids = set(self.tag_entities[first_tag])
-<<<<<<< HEAD
-
-        # Filter by remaining tags
-        for tag in tags[1:]:
-            entity_ids &= set(self.tag_entities[tag])
-
-        return [self.entities[entity_id] for entity_id in entity_ids
-                if entity_id in self.entities]
 
-    def set_flag(self, flag_name, value):
-        """
-        Set a global game flag.
+        # Intersect the stored sets directly, starting from the smallest, so
+        # the work is bounded by the rarest tag and no set is copied first
+        tag_entities = self.tag_entities
+        id_sets = [tag_entities.get(tag) for tag in tags]
+        if not all(id_sets):
+            return []
+        id_sets.sort(key=len)
+        entity_ids = id_sets[0].intersection(*id_sets[1:])
+
+        entities = self.entities
+        return [entities[entity_id] for entity_id in entity_ids
+                if entity_id in entities]
 
-=======
-        
-        # Filter by remaining tags
-        for tag in tags[1:]:
-            entity_ids &= set(self.tag_entities[tag])
-        
-        return [self.entities[entity_id] for entity_id in entity_ids
-                if entity_id in self.entities]
-    
     def set_flag(self, flag_name, value):
         """
         Set a global game flag.
-        
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
+
         Args:
             flag_name: The name of the flag
             value: The value to set
         """
         self.flags[flag_name] = value
-<<<<<<< HEAD
 
-=======
-        
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
         # Emit flag changed event
         self.event_manager.emit(EventType.FLAG_CHANGED, {
             "flag_name": flag_name,
             "value": value
         })
-<<<<<<< HEAD
 
     def get_flag(self, flag_name, default=None):
         """
@@ -550,56 +682,38 @@ class World:
             flag_name: The name of the flag
             default: Default value if flag is not set
 
-=======
-    
-    def get_flag(self, flag_name, default=None):
-        """
-        Get a global game flag.
-        
-        Args:
-            flag_name: The name of the flag
-            default: Default value if flag is not set
-            
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
         Returns:
             The flag value, or default if not set
         """
         return self.flags.get(flag_name, default)
-<<<<<<< HEAD
 
-=======
-    
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
     def clear(self):
         """Clear all entities and reset the world state."""
         # Emit world clearing event
         self.event_manager.emit(EventType.WORLD_CLEARING, {})
-<<<<<<< HEAD
 
-=======
-        
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
+        # Detach every entity's components, so transforms free their store rows
+        for entity in self.entities.values():
+            entity._reset()
+        for entity in self.pending_entities:
+            entity._reset()
+
         # Clear entities
         self.entities.clear()
-        self.component_entities.clear()
+        self.sparse_sets.clear()
         self.tag_entities.clear()
+        self.archetypes.clear()
+        self.entity_locations.clear()
+        self._archetype_queries.clear()
+        self._entity_queries.clear()
+        self.structural_version += 1
         self.pending_entities.clear()
         self.pending_removals.clear()
-<<<<<<< HEAD
 
-=======
-        
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
         # Reset state
         self.current_map_id = None
         self.game_time = 0.0
         self.flags.clear()
-<<<<<<< HEAD
 
         # Emit world cleared event
         self.event_manager.emit(EventType.WORLD_CLEARED, {})
-=======
-        
-        # Emit world cleared event
-        self.event_manager.emit(EventType.WORLD_CLEARED, {}) 
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
@@ -5,8 +5,4 @@ This module provides the event-driven architecture for the game.
 """
 
 from .event_manager import EventManager
-<<<<<<< HEAD
 from .event_types import EventType
-=======
-from .event_types import EventType 
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
@@ -16,7 +16,10 @@ class EventManager:
     
     def __init__(self):
         """Initialize the event manager."""
-        self.subscribers = defaultdict(list)  # Event type -> List of (handler, subscriber_id)
+        # Event type -> Tuple of (handler, subscriber_id). Tuples are replaced
+        # rather than mutated, so subscribing or unsubscribing from inside a
+        # handler never changes the sequence an emit is iterating
+        self.subscribers = defaultdict(tuple)
         self.deferred_events = []  # List of (event_type, data) to process next update
         self.defer_events = False  # Whether to defer events
     
@@ -32,7 +35,7 @@ class EventManager:
             function: A function that can be called to unsubscribe
         """
         subscriber_id = str(uuid.uuid4())
-        self.subscribers[event_type].append((handler, subscriber_id))
+        self.subscribers[event_type] += ((handler, subscriber_id),)
         
         # Return a function that can be called to unsubscribe
         def unsubscribe():
@@ -49,10 +52,10 @@ class EventManager:
             subscriber_id: The ID of the subscriber to remove
         """
         if event_type in self.subscribers:
-            self.subscribers[event_type] = [
+            self.subscribers[event_type] = tuple(
                 (handler, sid) for handler, sid in self.subscribers[event_type]
                 if sid != subscriber_id
-            ]
+            )
     
     def emit(self, event_type, data=None):
         """
@@ -62,16 +65,22 @@ class EventManager:
             event_type: The type of event to emit
             data: The data to pass to the event handlers
         """
-        if data is None:
-            data = {}
-        
         # If deferring events, add to deferred list
         if self.defer_events:
-            self.deferred_events.append((event_type, data))
+            self.deferred_events.append((event_type, {} if data is None else data))
+            return
+        
+        # Drop events nobody listens to before building any data; get()
+        # keeps the defaultdict from storing an empty list for the type
+        handlers = self.subscribers.get(event_type)
+        if not handlers:
             return
         
+        if data is None:
+            data = {}
+        
         # Call all subscribers for this event type
-        for handler, _ in self.subscribers[event_type]:
+        for handler, _ in handlers:
             try:
                 handler(data)
             except Exception as e:
@@ -85,7 +94,8 @@ class EventManager:
         """End deferring events and process all deferred events."""
         self.defer_events = False
         
-        # Process all deferred events
+        # Process all deferred events. The list is swapped out and walked
+        # once rather than popped from the front, so this stays linear.
         deferred = self.deferred_events
         self.deferred_events = []
         
@@ -102,7 +112,7 @@ class EventManager:
         if event_type is None:
             self.subscribers.clear()
         elif event_type in self.subscribers:
-            self.subscribers[event_type].clear()
+            self.subscribers[event_type] = ()
     
     def has_subscribers(self, event_type):
         """
@@ -114,8 +124,4 @@ class EventManager:
         Returns:
             bool: True if the event type has subscribers, False otherwise
         """
-<<<<<<< HEAD
         return event_type in self.subscribers and len(self.subscribers[event_type]) > 0
-=======
-        return event_type in self.subscribers and len(self.subscribers[event_type]) > 0 
->>>>>>> 48f82ac (Initial commit with isometric RPG engine)
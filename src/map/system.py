@@ -5,6 +5,7 @@ This system manages maps, handles loading and serialization, and facilitates
 interactions between entities and the map.
 """
 
+import gc
 import os
 import math
 from ..ecs.system import System
@@ -202,6 +203,11 @@ class MapSystem(System):
             if spawn_entities:
                 self._spawn_map_entities()
             
+            # The map lives for the rest of the level, so move it and
+            # everything else loaded so far out of the collector's scans
+            gc.collect()
+            gc.freeze()
+            
             return map_instance
         
         return None
@@ -161,10 +161,10 @@ class SpatialSystem(System):
         entities = self.world.get_entities_with_components([TransformComponent])
         
         # Update tracked entities
-        for entity_id in entities:
-            if entity_id not in self.tracked_entities:
-                transform = self.world.get_component(entity_id, TransformComponent)
-                self._add_entity_to_grid(entity_id, transform)
+        for entity in entities:
+            if entity.id not in self.tracked_entities:
+                transform = entity.get_component(TransformComponent)
+                self._add_entity_to_grid(entity.id, transform)
         
         # Ensure all tracked entities still exist and have transform components
         for entity_id in list(self.tracked_entities):
@@ -41,6 +41,9 @@ class MainMenuState(State):
         self.title_text = None
         self.option_texts = []
         self.background = None
+        
+        # The menu background covers the whole screen
+        self.needs_full_clear = False
     
     def enter(self):
         """Set up the main menu when entering the state."""
@@ -88,7 +91,15 @@ class MainMenuState(State):
         
         Args:
             surface: The surface to render to
+            
+        Returns:
+            list: Empty list if nothing changed, or None after a full redraw
         """
+        # The menu is static, so only redraw after something changed
+        if not self.needs_redraw:
+            return []
+        self.needs_redraw = False
+        
         # Draw background
         surface.blit(self.background, (0, 0))
         
@@ -104,6 +115,8 @@ class MainMenuState(State):
         for i, option_text in enumerate(self.option_texts):
             option_x = (surface.get_width() - option_text.get_width()) // 2
             surface.blit(option_text, (option_x, option_y + i * option_spacing))
+        
+        return None
     
     def handle_event(self, event):
         """
@@ -138,6 +151,8 @@ class MainMenuState(State):
             color = UI_HIGHLIGHT_COLOR if i == self.selected_option else UI_TEXT_COLOR
             text = self.option_font.render(option, True, color)
             self.option_texts.append(text)
+        
+        self.invalidate()
     
     def _activate_selected_option(self):
         """Activate the currently selected menu option."""
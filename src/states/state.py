@@ -20,6 +20,12 @@ class State:
         self.state_manager = state_manager
         self.is_active = False
         self.is_paused = False
+        
+        # Whether the game should clear the screen before render()
+        self.needs_full_clear = True
+        
+        # Whether the next render() must redraw the whole surface
+        self.needs_redraw = True
     
     def enter(self):
         """
@@ -29,6 +35,7 @@ class State:
         """
         self.is_active = True
         self.is_paused = False
+        self.invalidate()
     
     def exit(self):
         """
@@ -54,6 +61,7 @@ class State:
         Override this method to resume the state.
         """
         self.is_paused = False
+        self.invalidate()
     
     def update(self, dt):
         """
@@ -68,10 +76,21 @@ class State:
         """
         Render the state.
         
+        States that track their own changes can return only the regions
+        they redrew. A full redraw must still happen whenever
+        needs_redraw is set.
+        
         Args:
             surface: The surface to render to
+            
+        Returns:
+            list: Rects that changed this frame, or None if the whole surface was redrawn
         """
-        pass
+        return None
+    
+    def invalidate(self):
+        """Request a full redraw on the next render."""
+        self.needs_redraw = True
     
     def handle_event(self, event):
         """
@@ -7,5 +7,7 @@ This module provides the system classes for the ECS.
 from ..ecs.system import System
 from .ai_system import AISystem
 from .combat_system import CombatSystem
+from .lifecycle_system import LifecycleSystem
+from .transform_system import TransformSystem
 from ..spatial.system import SpatialSystem
 from ..map.system import MapSystem 
\ No newline at end of file
@@ -6,8 +6,10 @@ This system processes AI components to make decisions for NPCs.
 
 import math
 import time
+import numpy as np
 from ..ecs.system import System
 from ..components import AIComponent, CharacterStatsComponent, TransformComponent
+from ..components.transform_math import batch_distance, gather_positions
 from ..events.event_types import EventType
 
 class AISystem(System):
@@ -59,9 +61,11 @@ class AISystem(System):
         # Get all entities with AI components
         entities = self.world.get_entities_with_components(self.required_components)
         
-        for entity_id in entities:
+        for entity in entities:
+            entity_id = entity.id
+            
             # Get the AI component
-            ai_component = self.world.get_component(entity_id, AIComponent)
+            ai_component = entity.get_component(AIComponent)
             
             # Skip if AI is disabled
             if not ai_component.enabled:
@@ -100,86 +104,87 @@ class AISystem(System):
         if not transform_component:
             return
         
-        entity_position = (transform_component.position[0], transform_component.position[1], transform_component.z)
-        
-        # Get all entities with transform components
+        # Get all entities with transform components and their positions
         entities = self.world.get_entities_with_components([TransformComponent])
+        transforms = [other.get_component(TransformComponent) for other in entities]
+        positions = gather_positions(transforms)
         
-        for other_id in entities:
+        # Measure the distance to every entity in one vectorized call
+        own_position = np.array([transform_component.x, transform_component.y])
+        distances = batch_distance(positions[:, :2], own_position)
+        
+        # Only visit entities within the perception radius
+        for index in np.flatnonzero(distances <= ai_component.perception_radius):
+            other_id = entities[index].id
+            
             # Skip self
             if other_id == entity_id:
                 continue
             
-            # Get the other entity's position
-            other_transform = self.world.get_component(other_id, TransformComponent)
-            other_position = (other_transform.position[0], other_transform.position[1], other_transform.z)
+            other_position = tuple(positions[index].tolist())
+            distance = float(distances[index])
             
-            # Calculate distance
-            distance = ai_component.calculate_distance(entity_position, other_position)
+            # Determine entity type (in a real implementation, this would use faction or team components)
+            entity_type = self._determine_entity_type(entity_id, other_id)
             
-            # Check if within perception radius
-            if distance <= ai_component.perception_radius:
-                # Determine entity type (in a real implementation, this would use faction or team components)
-                entity_type = self._determine_entity_type(entity_id, other_id)
+            # Add to perception
+            if entity_type == "enemy":
+                # Get stats if available
+                stats = None
+                stats_component = self.world.get_component(other_id, CharacterStatsComponent)
+                if stats_component:
+                    stats = stats_component
                 
-                # Add to perception
-                if entity_type == "enemy":
-                    # Get stats if available
-                    stats = None
-                    stats_component = self.world.get_component(other_id, CharacterStatsComponent)
-                    if stats_component:
-                        stats = stats_component
-                    
-                    ai_component.perception["enemies"].append({
-                        "id": other_id,
-                        "position": other_position,
-                        "distance": distance,
-                        "stats": stats
-                    })
-                    
-                    # Remember entity
-                    ai_component.remember_entity(other_id, other_position)
+                ai_component.perception["enemies"].append({
+                    "id": other_id,
+                    "position": other_position,
+                    "distance": distance,
+                    "stats": stats
+                })
                 
-                elif entity_type == "ally":
-                    # Get stats if available
-                    stats = None
-                    stats_component = self.world.get_component(other_id, CharacterStatsComponent)
-                    if stats_component:
-                        stats = stats_component
-                    
-                    ai_component.perception["allies"].append({
-                        "id": other_id,
-                        "position": other_position,
-                        "distance": distance,
-                        "stats": stats
-                    })
-                    
-                    # Remember entity
-                    ai_component.remember_entity(other_id, other_position)
+                # Remember entity
+                ai_component.remember_entity(other_id, other_position)
+            
+            elif entity_type == "ally":
+                # Get stats if available
+                stats = None
+                stats_component = self.world.get_component(other_id, CharacterStatsComponent)
+                if stats_component:
+                    stats = stats_component
                 
-                elif entity_type == "neutral":
-                    ai_component.perception["neutrals"].append({
-                        "id": other_id,
-                        "position": other_position,
-                        "distance": distance
-                    })
-                    
-                    # Remember entity
-                    ai_component.remember_entity(other_id, other_position)
+                ai_component.perception["allies"].append({
+                    "id": other_id,
+                    "position": other_position,
+                    "distance": distance,
+                    "stats": stats
+                })
                 
-                elif entity_type == "item":
-                    ai_component.perception["items"].append({
-                        "id": other_id,
-                        "position": other_position,
-                        "distance": distance
-                    })
+                # Remember entity
+                ai_component.remember_entity(other_id, other_position)
+            
+            elif entity_type == "neutral":
+                ai_component.perception["neutrals"].append({
+                    "id": other_id,
+                    "position": other_position,
+                    "distance": distance
+                })
                 
-                elif entity_type == "hazard":
-                    ai_component.perception["hazards"].append({
-                        "id": other_id,
-                        "position": other_position,
-                        "distance": distance
-                    })
+                # Remember entity
+                ai_component.remember_entity(other_id, other_position)
+            
+            elif entity_type == "item":
+                ai_component.perception["items"].append({
+                    "id": other_id,
+                    "position": other_position,
+                    "distance": distance
+                })
+            
+            elif entity_type == "hazard":
+                ai_component.perception["hazards"].append({
+                    "id": other_id,
+                    "position": other_position,
+                    "distance": distance
+                })
     
     def _determine_entity_type(self, entity_id, other_id):
         """
@@ -226,7 +231,7 @@ class AISystem(System):
         if not transform_component:
             return
         
-        entity_position = (transform_component.position[0], transform_component.position[1], transform_component.z)
+        entity_position = (transform_component.x, transform_component.y, transform_component.z)
         
         # Get the entity's stats
         stats_component = self.world.get_component(entity_id, CharacterStatsComponent)
@@ -360,14 +365,14 @@ class AISystem(System):
         if not transform_component:
             return
         
-        entity_position = (transform_component.position[0], transform_component.position[1], transform_component.z)
+        entity_position = (transform_component.x, transform_component.y, transform_component.z)
         
         # Get the target's position
         target_transform = self.world.get_component(target_id, TransformComponent)
         if not target_transform:
             return
         
-        target_position = (target_transform.position[0], target_transform.position[1], target_transform.z)
+        target_position = (target_transform.x, target_transform.y, target_transform.z)
         
         # Calculate distance to target
         distance = ai_component.calculate_distance(entity_position, target_position)
@@ -389,8 +394,8 @@ class AISystem(System):
             
             # Update position
             new_position = (
-                transform_component.position[0] + direction[0] * 2.0 * 0.016,  # Assuming 60 FPS
-                transform_component.position[1] + direction[1] * 2.0 * 0.016
+                transform_component.x + direction[0] * 2.0 * 0.016,  # Assuming 60 FPS
+                transform_component.y + direction[1] * 2.0 * 0.016
             )
             
             transform_component.set_position(new_position)
@@ -476,7 +481,7 @@ class AISystem(System):
         if not transform_component:
             return
         
-        entity_position = (transform_component.position[0], transform_component.position[1], transform_component.z)
+        entity_position = (transform_component.x, transform_component.y, transform_component.z)
         
         # Find the nearest enemy
         nearest_enemy_id, nearest_enemy_distance = ai_component.find_nearest_enemy(entity_position)
@@ -487,7 +492,7 @@ class AISystem(System):
             if not enemy_transform:
                 return
             
-            enemy_position = (enemy_transform.position[0], enemy_transform.position[1], enemy_transform.z)
+            enemy_position = (enemy_transform.x, enemy_transform.y, enemy_transform.z)
             
             # Calculate direction away from enemy
             direction = (
@@ -497,8 +502,8 @@ class AISystem(System):
             
             # Update position
             new_position = (
-                transform_component.position[0] + direction[0] * 3.0 * 0.016,  # Faster than normal movement
-                transform_component.position[1] + direction[1] * 3.0 * 0.016
+                transform_component.x + direction[0] * 3.0 * 0.016,  # Faster than normal movement
+                transform_component.y + direction[1] * 3.0 * 0.016
             )
             
             transform_component.set_position(new_position)
@@ -550,14 +555,14 @@ class AISystem(System):
         if not transform_component:
             return
         
-        entity_position = (transform_component.position[0], transform_component.position[1], transform_component.z)
+        entity_position = (transform_component.x, transform_component.y, transform_component.z)
         
         # Get the target's position
         target_transform = self.world.get_component(target_id, TransformComponent)
         if not target_transform:
             return
         
-        target_position = (target_transform.position[0], target_transform.position[1], target_transform.z)
+        target_position = (target_transform.x, target_transform.y, target_transform.z)
         
         # Calculate distance to target
         distance = ai_component.calculate_distance(entity_position, target_position)
@@ -572,8 +577,8 @@ class AISystem(System):
             
             # Update position
             new_position = (
-                transform_component.position[0] + direction[0] * 2.0 * 0.016,  # Assuming 60 FPS
-                transform_component.position[1] + direction[1] * 2.0 * 0.016
+                transform_component.x + direction[0] * 2.0 * 0.016,  # Assuming 60 FPS
+                transform_component.y + direction[1] * 2.0 * 0.016
             )
             
             transform_component.set_position(new_position)
@@ -7,12 +7,15 @@ combat state management, and threat.
 
 import math
 import random
-import time
+import numpy as np
+from ..core import tick_clock
 from ..ecs.system import System
 from ..components.combat import CombatComponent, CombatStance, AttackType
 from ..components.character_stats import CharacterStatsComponent
 from ..components.transform import TransformComponent
+from ..components.transform_math import gather_positions, pairwise_sq_dist_xy
 from ..events.event_types import EventType
+from .lifecycle_system import LifecycleSystem
 
 class CombatSystem(System):
     """
@@ -20,6 +23,10 @@ class CombatSystem(System):
     
     This system processes entities with combat components to handle
     combat mechanics like attacking, defending, and combat state management.
+    
+    Cooldowns and timed effects are counted down by LifecycleSystem, not
+    here; adding this system to a world without one adds a LifecycleSystem
+    too, so cooldowns never stay active forever.
     """
     
     def __init__(self, world, event_manager):
@@ -50,9 +57,19 @@ class CombatSystem(System):
         # Time to exit combat after no combat actions
         self.combat_exit_time = 6.0  # Exit combat after 6 seconds of no actions
         
+        # Squared distances between combat entities, valid during update()
+        self._distance_ids = None
+        self._distance_rows = None
+        self._sq_distances = None
+        
         # Subscribe to events
         self._subscribe_to_events()
     
+    def initialize(self):
+        """Add a LifecycleSystem to the world if it has none, to tick cooldowns."""
+        if not any(isinstance(system, LifecycleSystem) for system in self.world.systems):
+            self.world.add_system(LifecycleSystem(self.world))
+    
     def _subscribe_to_events(self):
         """Subscribe to relevant events."""
         self.event_manager.subscribe(EventType.ENTITY_MOVED, self._on_entity_moved)
@@ -113,13 +130,14 @@ class CombatSystem(System):
         # Get entities with required components
         entities = self.world.get_entities_with_components(self.required_components)
         
-        current_time = time.time()
+        current_time = tick_clock.now()
         
-        for entity_id in entities:
-            combat_comp = self.world.get_component(entity_id, CombatComponent)
-            
-            # Update cooldowns
-            combat_comp.update_cooldowns(dt)
+        # Measure every pair of combat entities once instead of per query
+        self._build_distance_table()
+        
+        for entity in entities:
+            entity_id = entity.id
+            combat_comp = entity.get_component(CombatComponent)
             
             # Check if we should exit combat due to inactivity
             if combat_comp.in_combat and current_time - combat_comp.last_combat_action_time > self.combat_exit_time:
@@ -127,11 +145,35 @@ class CombatSystem(System):
                 self._exit_combat(entity_id, combat_comp)
             
             # Process auto-attacks
-            if combat_comp.should_auto_attack(current_time):
+            if combat_comp.should_auto_attack():
                 self._process_auto_attack(entity_id, combat_comp)
             
             # Update combat state based on targets
             self._update_combat_state(entity_id, combat_comp)
+        
+        # Apply the combat statistics buffered during this tick
+        for entity in entities:
+            entity.get_component(CombatComponent).flush(current_time)
+        
+        # Positions may change before the next update, so drop the table
+        self._distance_ids = None
+        self._distance_rows = None
+        self._sq_distances = None
+    
+    def _build_distance_table(self):
+        """Compute squared ground distances between all combat entities."""
+        ids = []
+        transforms = []
+        for entity in self.world.get_entities_with_components([CombatComponent]):
+            transform = entity.get_component(TransformComponent)
+            if transform:
+                ids.append(entity.id)
+                transforms.append(transform)
+        
+        positions = gather_positions(transforms)
+        self._distance_ids = ids
+        self._distance_rows = {entity_id: row for row, entity_id in enumerate(ids)}
+        self._sq_distances = pairwise_sq_dist_xy(positions[:, 0], positions[:, 1])
     
     def _update_combat_state(self, entity_id, combat_comp):
         """
@@ -173,8 +215,8 @@ class CombatSystem(System):
             return
         
         # Calculate distance to target
-        dx = target_transform.position.x - entity_transform.position.x
-        dy = target_transform.position.y - entity_transform.position.y
+        dx = target_transform.x - entity_transform.x
+        dy = target_transform.y - entity_transform.y
         distance = math.sqrt(dx*dx + dy*dy)
         
         # AI components might use this information to decide whether to
@@ -264,8 +306,8 @@ class CombatSystem(System):
             return False
         
         # Calculate distance
-        dx = target_transform.position.x - attacker_transform.position.x
-        dy = target_transform.position.y - attacker_transform.position.y
+        dx = target_transform.x - attacker_transform.x
+        dy = target_transform.y - attacker_transform.y
         distance = math.sqrt(dx*dx + dy*dy)
         
         # Check if in range based on attack type
@@ -283,6 +325,12 @@ class CombatSystem(System):
         Returns:
             list: List of nearby enemy entity IDs
         """
+        # Answer from this frame's distance table when it covers the entity
+        if self._distance_rows is not None and entity_id in self._distance_rows:
+            row = self._distance_rows[entity_id]
+            in_range = np.flatnonzero(self._sq_distances[row] <= max_range * max_range)
+            return [self._distance_ids[other] for other in in_range if other != row]
+        
         # Get all entities with combat components
         all_combat_entities = self.world.get_entities_with_components([CombatComponent])
         
@@ -293,19 +341,21 @@ class CombatSystem(System):
         
         nearby_enemies = []
         
-        for other_id in all_combat_entities:
+        for other_entity in all_combat_entities:
+            other_id = other_entity.id
+            
             # Skip self
             if other_id == entity_id:
                 continue
             
             # Get other entity transform
-            other_transform = self.world.get_component(other_id, TransformComponent)
+            other_transform = other_entity.get_component(TransformComponent)
             if not other_transform:
                 continue
             
             # Calculate distance
-            dx = other_transform.position.x - entity_transform.position.x
-            dy = other_transform.position.y - entity_transform.position.y
+            dx = other_transform.x - entity_transform.x
+            dy = other_transform.y - entity_transform.y
             distance = math.sqrt(dx*dx + dy*dy)
             
             # Check if in range
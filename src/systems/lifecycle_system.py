@@ -0,0 +1,46 @@
+"""
+Lifecycle system for the Entity Component System.
+
+This system advances timed component state such as cooldowns, stat
+modifiers and status effects.
+"""
+
+from ..core import tick_clock
+from ..ecs.system import System
+from ..components.combat import CombatComponent
+from ..components.character_stats import CharacterStatsComponent
+
+class LifecycleSystem(System):
+    """
+    System that expires timed state on combat and stats components.
+    
+    Each component's tick() handles all of its timers at once, so every
+    component is visited a single time per frame.
+    """
+    
+    def __init__(self, world):
+        """
+        Initialize the lifecycle system.
+        
+        Args:
+            world: The world this system belongs to
+        """
+        super().__init__(world)
+        self.required_components = [CombatComponent, CharacterStatsComponent]
+        self.priority = 10  # Run before systems that read cooldowns and effects
+    
+    def update(self, dt):
+        """
+        Tick every combat and character stats component.
+        
+        Args:
+            dt: Delta time in seconds
+        """
+        if not self.enabled:
+            return
+        
+        now = tick_clock.now()
+        
+        for component_type in self.required_components:
+            for component in self.world.get_components(component_type):
+                component.tick(dt, now)
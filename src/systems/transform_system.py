@@ -0,0 +1,43 @@
+"""
+Transform system for the Entity Component System.
+
+This system finishes each frame's movement by committing every
+transform's current position as its previous position.
+"""
+
+from ..ecs.system import System
+from ..components.transform import TransformComponent
+from ..components.transform_store import TRANSFORM_STORE
+
+class TransformSystem(System):
+    """
+    System that updates all transforms at once through the transform store.
+    
+    Rather than visiting entities one by one, it operates on the store's
+    columns, so the cost is a few array copies regardless of entity count.
+    """
+    
+    def __init__(self, world, store=TRANSFORM_STORE):
+        """
+        Initialize the transform system.
+        
+        Args:
+            world: The world this system belongs to
+            store: Transform store holding the transform columns
+        """
+        super().__init__(world)
+        self.required_components = [TransformComponent]
+        self.store = store
+        self.priority = -100  # Run after every system that moves entities
+    
+    def update(self, dt):
+        """
+        Commit this frame's positions for every transform.
+        
+        Args:
+            dt: Delta time in seconds
+        """
+        if not self.enabled:
+            return
+        
+        self.store.update_previous_positions()
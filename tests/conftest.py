@@ -0,0 +1,42 @@
+"""
+Shared fixtures for the test suite.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Let pygame import without a display, and make the src package importable
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core import tick_clock
+from src.ecs import World
+from src.events import EventManager
+
+@pytest.fixture
+def clock(monkeypatch):
+    """
+    Replace the wall clock read by the tick clock with a manual one.
+
+    Returns:
+        list: One-item list holding the current time; assign to it to
+        move the clock before the next World.update()
+    """
+    current = [1000.0]
+    monkeypatch.setattr(tick_clock, "_time", lambda: current[0])
+    tick_clock.advance()
+    return current
+
+@pytest.fixture
+def event_manager():
+    """Create an event manager."""
+    return EventManager()
+
+@pytest.fixture
+def world(event_manager):
+    """Create an empty world."""
+    world = World(event_manager)
+    yield world
+    world.shutdown()
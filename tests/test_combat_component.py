@@ -0,0 +1,45 @@
+"""
+Tests for the combat component.
+"""
+
+import json
+
+from src.components import CombatComponent
+
+def test_json_round_trip_restores_integer_entity_ids():
+    combat = CombatComponent()
+    combat.set_target(5)
+    combat.add_targeted_by(7)
+    combat.add_threat(5, 10.0)
+
+    data = json.loads(json.dumps(combat.serialize()))
+    restored = CombatComponent.deserialize(data)
+
+    assert restored.current_target_id == 5
+    assert restored.targeted_by == {7}
+    assert dict(restored.threat_table) == {5: 10.0}
+    assert restored.get_highest_threat_entity() == (5, 10.0)
+
+def test_legacy_uuid_ids_are_kept_as_strings():
+    legacy_id = "0b7c2d9e-5f1a-4c3b-9e8d-7a6f5e4d3c2b"
+    restored = CombatComponent.deserialize({"current_target_id": legacy_id})
+
+    assert restored.current_target_id == legacy_id
+
+def test_deserialize_cache_keeps_equal_values_of_different_types_apart():
+    from_bool = CombatComponent.deserialize({"auto_attack_enabled": True, "kills": 1})
+    from_int = CombatComponent.deserialize({"auto_attack_enabled": 1, "kills": True})
+
+    assert from_bool.kills == 1 and type(from_bool.kills) is int
+    assert type(from_int.kills) is bool
+    assert not hasattr(from_bool, "_template")
+
+def test_deserialize_returns_independent_copies():
+    data = {"kills": 3}
+    first = CombatComponent.deserialize(data)
+    second = CombatComponent.deserialize(data)
+
+    first.add_threat(1, 5.0)
+
+    assert first is not second
+    assert dict(second.threat_table) == {}
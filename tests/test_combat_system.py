@@ -0,0 +1,66 @@
+"""
+Tests for the combat system.
+"""
+
+from src.components import CharacterStatsComponent, CombatComponent, TransformComponent
+from src.systems.combat_system import CombatSystem
+from src.systems.lifecycle_system import LifecycleSystem
+
+def _spawn_fighter(world, x, y):
+    combat = CombatComponent()
+    entity = world.spawn([TransformComponent(x, y), CharacterStatsComponent(), combat])
+    return entity, combat
+
+def test_update_keeps_combat_while_enemy_in_range(world, event_manager, clock):
+    system = world.add_system(CombatSystem(world, event_manager))
+    _, combat = _spawn_fighter(world, 0, 0)
+    _spawn_fighter(world, 3, 4)
+    combat.enter_combat()
+    combat.update_last_combat_action_time()
+
+    world.update(0.016)
+
+    # The other fighter is 5 units away, inside the detection range
+    assert combat.in_combat
+    assert system._sq_distances is None
+
+def test_update_exits_combat_when_no_enemy_in_range(world, event_manager, clock):
+    system = world.add_system(CombatSystem(world, event_manager))
+    _, combat = _spawn_fighter(world, 0, 0)
+    _spawn_fighter(world, 3, 4)
+    system.combat_detection_range = 4.0
+    combat.enter_combat()
+    combat.update_last_combat_action_time()
+
+    world.update(0.016)
+
+    assert not combat.in_combat
+
+def test_find_nearby_enemies_uses_distance_table(world, event_manager, clock):
+    system = world.add_system(CombatSystem(world, event_manager))
+    first, _ = _spawn_fighter(world, 0, 0)
+    second, _ = _spawn_fighter(world, 3, 4)
+    far, _ = _spawn_fighter(world, 50, 0)
+    world.update(0.016)
+
+    system._build_distance_table()
+    assert system._find_nearby_enemies(first.id, 10.0) == [second.id]
+    assert system._find_nearby_enemies(far.id, 10.0) == []
+
+def test_adding_combat_system_adds_lifecycle_system_once(world, event_manager, clock):
+    world.add_system(LifecycleSystem(world))
+    world.add_system(CombatSystem(world, event_manager))
+
+    assert sum(isinstance(system, LifecycleSystem) for system in world.systems) == 1
+
+def test_cooldowns_expire_with_only_combat_system_added(world, event_manager, clock):
+    world.add_system(CombatSystem(world, event_manager))
+    _, combat = _spawn_fighter(world, 0, 0)
+    world.update(0.016)
+
+    combat.start_global_cooldown(1.0)
+    assert combat.is_on_cooldown("slash")
+
+    clock[0] += 1.5
+    world.update(1.5)
+    assert not combat.is_on_cooldown("slash")
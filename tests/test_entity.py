@@ -0,0 +1,44 @@
+"""
+Tests for entities.
+"""
+
+import pytest
+
+from src.ecs import Entity
+
+def test_tags_round_trip_through_the_tag_mask():
+    entity = Entity().add_tag("player").add_tag("enemy").remove_tag("player")
+
+    assert entity.tags == {"enemy"}
+    assert entity.has_tag("enemy")
+    assert not entity.has_tag("player")
+    assert entity.has_tags(["enemy"])
+
+def test_tags_cannot_be_mutated_directly():
+    entity = Entity().add_tag("player")
+
+    with pytest.raises(AttributeError):
+        entity.tags.add("enemy")
+    assert entity.tags == {"player"}
+
+def test_deserializing_a_live_id_gives_the_entity_a_new_id(world):
+    from src.components import TransformComponent
+
+    world.register_component(TransformComponent)
+    live = world.spawn([TransformComponent(1, 2)])
+    world.update(0.016)
+    data = live.serialize()
+
+    loaded = Entity.deserialize(world, data, world.component_registry)
+    world.pending_entities.append(loaded)
+    world.update(0.016)
+
+    assert loaded.id != live.id
+    assert loaded.uuid == str(live.id)
+    assert world.entities[live.id] is live
+    assert world.entities[loaded.id] is loaded
+    found = world.get_entities_with_components([TransformComponent])
+    assert sorted(entity.id for entity in found) == sorted([live.id, loaded.id])
+    for entity in found:
+        archetype, row = world.entity_locations[entity.id]
+        assert archetype.entities[row] is entity
@@ -0,0 +1,26 @@
+"""
+Tests for the game loop helpers.
+"""
+
+import pygame
+
+from src.core.game import _disjoint_regions
+
+def _covered_pixels(rects):
+    pixels = []
+    for rect in rects:
+        pixels.extend((x, y) for x in range(rect.left, rect.right) for y in range(rect.top, rect.bottom))
+    return pixels
+
+def test_overlapping_dirty_rects_cover_each_pixel_once():
+    bounds = pygame.Rect(0, 0, 40, 30)
+    dirty = [pygame.Rect(0, 0, 20, 20), (10, 5, 20, 20), pygame.Rect(5, 5, 5, 5), (30, 20, 20, 20)]
+
+    regions = _disjoint_regions(dirty, bounds)
+
+    pixels = _covered_pixels(regions)
+    expected = set()
+    for rect in dirty:
+        expected.update(_covered_pixels([bounds.clip(rect)]))
+    assert len(pixels) == len(set(pixels))
+    assert set(pixels) == expected
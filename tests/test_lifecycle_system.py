@@ -0,0 +1,40 @@
+"""
+Tests for the lifecycle system.
+"""
+
+from src.components import CharacterStatsComponent, CombatComponent
+from src.systems.lifecycle_system import LifecycleSystem
+
+def test_timed_modifier_expires_during_world_update(world, clock):
+    world.add_system(LifecycleSystem(world))
+    stats = CharacterStatsComponent()
+    entity = world.spawn([stats, CombatComponent()])
+    world.update(0.016)
+
+    base_strength = stats.current_stats["strength"]
+    stats.add_modifier("potion", "strength", 5, duration=2.0)
+    assert stats.current_stats["strength"] == base_strength + 5
+
+    # Still active before the duration has passed
+    clock[0] += 1.0
+    world.update(1.0)
+    assert "potion" in stats.modifiers
+
+    clock[0] += 1.5
+    world.update(1.5)
+    assert "potion" not in stats.modifiers
+    assert stats.current_stats["strength"] == base_strength
+    assert entity.id in world.entities
+
+def test_timed_status_effect_expires_during_world_update(world, clock):
+    world.add_system(LifecycleSystem(world))
+    stats = CharacterStatsComponent()
+    world.spawn([stats, CombatComponent()])
+    world.update(0.016)
+
+    stats.add_status_effect("burn", "burning", duration=1.0)
+    assert stats.has_status_effect("burning")
+
+    clock[0] += 2.0
+    world.update(2.0)
+    assert not stats.has_status_effect("burning")
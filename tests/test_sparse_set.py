@@ -0,0 +1,41 @@
+"""
+Tests for sparse set component storage.
+"""
+
+from src.ecs import SparseSet
+
+def test_insert_get_and_swap_remove():
+    sparse_set = SparseSet()
+    for entity_id in (1, 2, 3):
+        sparse_set.insert(entity_id, f"c{entity_id}")
+
+    assert sparse_set.remove(1) == "c1"
+    assert 1 not in sparse_set
+    assert sparse_set.get(3) == "c3"
+    assert sorted(sparse_set.entities) == [2, 3]
+    assert sparse_set.remove(1) is None
+
+def test_removing_last_entry_does_not_leave_it_indexed():
+    sparse_set = SparseSet()
+    sparse_set.insert(7, "c7")
+
+    sparse_set.remove(7)
+
+    assert 7 not in sparse_set
+    assert len(sparse_set) == 0
+
+def test_large_ids_use_memory_for_live_entries_only():
+    sparse_set = SparseSet()
+    sparse_set.insert(2 ** 40, "big")
+
+    assert sparse_set.get(2 ** 40) == "big"
+    assert len(sparse_set.sparse) == 1
+
+def test_index_does_not_grow_with_entity_churn():
+    sparse_set = SparseSet()
+    for entity_id in range(1, 10001):
+        sparse_set.insert(entity_id, entity_id)
+        sparse_set.remove(entity_id - 1)
+
+    assert len(sparse_set.sparse) == 1
+    assert sparse_set.get(10000) == 10000
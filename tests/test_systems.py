@@ -0,0 +1,46 @@
+"""
+Tests that run the gameplay systems together through World.update.
+"""
+
+from src.components import (
+    AIComponent,
+    CharacterStatsComponent,
+    CombatComponent,
+    TransformComponent,
+)
+from src.systems.ai_system import AISystem
+from src.systems.combat_system import CombatSystem
+from src.systems.lifecycle_system import LifecycleSystem
+
+def _spawn_npc(world, x, y, ai_type="utility"):
+    components = [
+        TransformComponent(x, y),
+        AIComponent(ai_type),
+        CharacterStatsComponent(),
+        CombatComponent(),
+    ]
+    return world.spawn(components)
+
+def test_world_update_runs_lifecycle_combat_and_ai(world, event_manager, clock):
+    world.add_system(LifecycleSystem(world))
+    world.add_system(CombatSystem(world, event_manager))
+    world.add_system(AISystem(world, event_manager))
+    npcs = [
+        _spawn_npc(world, 0, 0, "utility"),
+        _spawn_npc(world, 2, 0, "state"),
+        _spawn_npc(world, 0, 2, "behavior_tree"),
+        _spawn_npc(world, 40, 40, "utility"),
+    ]
+    stats = npcs[0].get_component(CharacterStatsComponent)
+    stats.add_modifier("potion", "strength", 5, duration=0.5)
+
+    for _ in range(10):
+        clock[0] += 0.1
+        world.update(0.1)
+
+    assert "potion" not in stats.modifiers
+    # Nearby NPCs see each other, the distant one sees nobody
+    seen = {enemy["id"] for enemy in npcs[0].get_component(AIComponent).perception["enemies"]}
+    assert seen == {npcs[1].id, npcs[2].id}
+    assert npcs[3].get_component(AIComponent).perception["enemies"] == []
+    assert all(npc.id in world.entities for npc in npcs)
@@ -0,0 +1,63 @@
+"""
+Tests for the transform component and its store rows.
+"""
+
+from src.components import TransformComponent
+from src.components.transform_store import TRANSFORM_STORE
+
+def test_position_view_keeps_its_transform_alive():
+    transform = TransformComponent(1, 2)
+    position = transform.position
+    del transform
+
+    other = TransformComponent(9, 9)
+
+    assert (position.x, position.y) == (1.0, 2.0)
+    other.x = 5
+    assert position.x == 1.0
+
+def test_destroying_entity_frees_its_row_and_keeps_views_valid(world):
+    transform = TransformComponent(3, 4)
+    entity = world.spawn([transform])
+    world.update(0.016)
+    position = transform.position
+    row = transform.store_index
+
+    entity.destroy()
+    world.update(0.016)
+
+    assert row in TRANSFORM_STORE._free_rows
+    assert transform._store is not TRANSFORM_STORE
+    assert (position.x, position.y) == (3.0, 4.0)
+
+    # A new transform may take the freed row without touching the old view
+    TransformComponent(9, 9)
+    assert (position.x, position.y) == (3.0, 4.0)
+
+def test_removed_transform_keeps_values_and_can_be_reattached(world):
+    transform = TransformComponent(3, 4, 5)
+    entity = world.spawn([transform])
+    world.update(0.016)
+    row = transform.store_index
+
+    entity.remove_component(TransformComponent)
+    assert row in TRANSFORM_STORE._free_rows
+    assert (transform.x, transform.y, transform.z) == (3.0, 4.0, 5.0)
+
+    transform.move(1, 1)
+    entity.add_component(transform)
+
+    assert transform._store is TRANSFORM_STORE
+    assert (transform.x, transform.y, transform.z) == (4.0, 5.0, 5.0)
+    assert transform.previous_position.x == 3.0
+
+def test_world_clear_frees_transform_rows(world):
+    transforms = [TransformComponent(i, i) for i in range(3)]
+    for transform in transforms:
+        world.spawn([transform])
+    world.update(0.016)
+    rows = [transform.store_index for transform in transforms]
+
+    world.clear()
+
+    assert set(rows) <= set(TRANSFORM_STORE._free_rows)
@@ -0,0 +1,20 @@
+"""
+Tests for the core utilities.
+"""
+
+import pygame
+
+from src.core.utils import render_text
+
+def test_render_text_cache_follows_font_style_changes():
+    pygame.font.init()
+    font = pygame.font.Font(None, 24)
+
+    plain = render_text("Hello world", font, (255, 255, 255))
+    font.set_bold(True)
+    bold = render_text("Hello world", font, (255, 255, 255))
+    font.set_bold(False)
+
+    assert bold is not plain
+    assert pygame.image.tobytes(bold, "RGBA") != pygame.image.tobytes(plain, "RGBA")
+    assert render_text("Hello world", font, (255, 255, 255)) is plain
@@ -0,0 +1,128 @@
+"""
+Tests for the world's system scheduling.
+"""
+
+import threading
+
+import pytest
+
+from src.ecs import Component, System
+
+class _Position(Component):
+    pass
+
+class _Velocity(Component):
+    pass
+
+class _RecordingSystem(System):
+    """System that records the thread it ran on and can wait on a barrier."""
+
+    def __init__(self, world, reads=(), writes=(), parallel=True, barrier=None):
+        super().__init__(world)
+        self.required_components = frozenset([_Position])
+        self.reads = frozenset(reads)
+        self.writes = frozenset(writes)
+        self.parallel = parallel
+        self.barrier = barrier
+        self.threads = []
+        self.seen = []
+
+    def update(self, dt):
+        self.threads.append(threading.current_thread())
+        self.seen.append(len(self.get_entities()))
+        if self.barrier is not None:
+            self.barrier.wait()
+
+def test_non_conflicting_parallel_systems_run_together(world):
+    world.MAX_SYSTEM_WORKERS = 2
+    world.spawn([_Position()])
+
+    # Each system waits for the other, so this only finishes if they overlap
+    barrier = threading.Barrier(2, timeout=5)
+    first = world.add_system(_RecordingSystem(world, reads=[_Position], barrier=barrier))
+    second = world.add_system(_RecordingSystem(world, reads=[_Position], barrier=barrier))
+
+    world.update(0.016)
+
+    assert first.seen == second.seen == [1]
+    assert first.threads[0] is not threading.main_thread()
+    assert first.threads[0] is not second.threads[0]
+
+def test_conflicting_parallel_systems_run_in_separate_waves(world):
+    world.MAX_SYSTEM_WORKERS = 2
+    writer = world.add_system(_RecordingSystem(world, writes=[_Position]))
+    reader = world.add_system(_RecordingSystem(world, reads=[_Position]))
+    assert writer.conflicts_with(reader)
+
+    world.update(0.016)
+
+    # Each ends up in a wave of one, which runs on the calling thread
+    assert writer.threads == [threading.main_thread()]
+    assert reader.threads == [threading.main_thread()]
+    assert world._executor is None
+
+def test_non_parallel_system_runs_on_main_thread(world):
+    system = world.add_system(_RecordingSystem(world, parallel=False))
+
+    world.update(0.016)
+
+    assert system.threads == [threading.main_thread()]
+
+def test_parallel_system_errors_reach_the_caller(world):
+    world.MAX_SYSTEM_WORKERS = 2
+
+    class _Failing(_RecordingSystem):
+        def update(self, dt):
+            raise RuntimeError("boom")
+
+    world.add_system(_Failing(world, reads=[_Velocity]))
+    world.add_system(_RecordingSystem(world, reads=[_Position]))
+
+    with pytest.raises(RuntimeError):
+        world.update(0.016)
+
+def test_shutdown_stops_the_worker_pool(world):
+    world.MAX_SYSTEM_WORKERS = 2
+    world.add_system(_RecordingSystem(world, reads=[_Position]))
+    world.add_system(_RecordingSystem(world, reads=[_Position]))
+    world.update(0.016)
+    executor = world._executor
+    assert executor is not None
+
+    world.shutdown()
+
+    assert world._executor is None
+    with pytest.raises(RuntimeError):
+        executor.submit(lambda: None)
+
+def test_primary_component_defaults_to_first_required_type_by_name(world):
+    system = System(world)
+    system.required_components = frozenset([_Velocity, _Position])
+
+    assert system.get_primary_component() is _Position
+
+    system.primary_component = _Velocity
+    assert system.get_primary_component() is _Velocity
+
+def test_sort_groups_equal_priority_systems_in_insertion_order(world):
+    def add(required, priority=0):
+        system = System(world)
+        system.required_components = frozenset(required)
+        system.priority = priority
+        return world.add_system(system)
+
+    a = add([_Position])
+    b = add([_Velocity])
+    c = add([_Position, _Velocity])
+    d = add([_Velocity])
+    e = add([], priority=5)
+
+    world.sort_systems()
+    assert world.systems == [e, a, c, b, d]
+
+    # Moving a system away and back restores its place in its group
+    a.set_priority(1)
+    world.sort_systems()
+    a.set_priority(0)
+    world.sort_systems()
+    assert world.systems == [e, a, c, b, d]